@@ -2,78 +2,85 @@
 FastAPI configuration settings
 """
 
-import os
-from typing import List
+from functools import cached_property, lru_cache
+from typing import ClassVar, Dict, Optional
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    """Application settings"""
+    """Application settings (values are read from the environment when instantiated)"""
 
     # API Configuration
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Product Analysis API"
     VERSION: str = "1.0.0"
 
-    # CORS Origins
-    BACKEND_CORS_ORIGINS: List[str] = [
-        "http://localhost:5000",  # React dev server
-        "http://localhost:5001",  # Alternative port
-        "http://localhost:5002",  # Alternative port
-        "http://localhost:3000",  # Alternative port
-        "http://127.0.0.1:5000",
-        "http://127.0.0.1:5001",
-        "http://127.0.0.1:5002",
-        "http://127.0.0.1:3000",
-    ]
+    # CORS Origins - React dev server (5000) and alternative ports on localhost/127.0.0.1
+    BACKEND_CORS_ORIGIN_REGEX: str = r"^http://(localhost|127\.0\.0\.1):(3000|5000|5001|5002)$"
 
     # Redis Configuration
-    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
-    REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
-    REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
-    REDIS_PASSWORD: str = os.getenv("REDIS_PASSWORD", "")
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str = ""
 
     # LLM Configuration
-    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "google")
-    LLM_MODEL: str = os.getenv("LLM_MODEL", "")
+    LLM_PROVIDER: str = "google"
+    LLM_MODEL: str = ""
 
     # API Keys for different LLM providers
-    GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
-    GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
-    COHERE_API_KEY: str = os.getenv("COHERE_API_KEY", "")
-    OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    GOOGLE_API_KEY: str = ""
+    OPENAI_API_KEY: str = ""
+    ANTHROPIC_API_KEY: str = ""
+    GROQ_API_KEY: str = ""
+    COHERE_API_KEY: str = ""
+    OLLAMA_BASE_URL: str = "http://localhost:11434"
 
     # Other API Keys
-    SERPER_API_KEY: str = os.getenv("SERPER_API_KEY", "")
+    SERPER_API_KEY: str = ""
 
     # Search Provider Configuration
-    SEARCH_PROVIDER: str = os.getenv("SEARCH_PROVIDER", "duckduckgo")
-
+    SEARCH_PROVIDER: str = "duckduckgo"
+
+    # Chat Configuration - most recent messages returned by /chat/history
+    MAX_HISTORY: int = 50
+
+    # Provider -> API key field (None means no key is required)
+    _PROVIDER_KEY_FIELDS: ClassVar[Dict[str, Optional[str]]] = {
+        "google": "GOOGLE_API_KEY",
+        "openai": "OPENAI_API_KEY",
+        "anthropic": "ANTHROPIC_API_KEY",
+        "groq": "GROQ_API_KEY",
+        "cohere": "COHERE_API_KEY",
+        "ollama": None,  # Ollama doesn't need an API key, just a base URL
+    }
+
+    @cached_property
     def has_llm_configured(self) -> bool:
-        """Check if any LLM provider is configured with an API key"""
-        provider_keys = {
-            "google": self.GOOGLE_API_KEY,
-            "openai": self.OPENAI_API_KEY,
-            "anthropic": self.ANTHROPIC_API_KEY,
-            "groq": self.GROQ_API_KEY,
-            "cohere": self.COHERE_API_KEY,
-            "ollama": True,  # Ollama doesn't need an API key, just a base URL
-        }
-
+        """Check if any LLM provider is configured with an API key (computed once)"""
         # Check if the configured provider has a key (or is Ollama)
         current_provider = self.LLM_PROVIDER.lower()
-        if current_provider in provider_keys:
-            key_or_available = provider_keys[current_provider]
-            return bool(key_or_available)
+        if current_provider in self._PROVIDER_KEY_FIELDS:
+            key_field = self._PROVIDER_KEY_FIELDS[current_provider]
+            return key_field is None or bool(getattr(self, key_field))
 
         # Fallback: Check if ANY provider has a key
-        return any(bool(key) for provider, key in provider_keys.items() if provider != "ollama") or current_provider == "ollama"
+        return any(
+            bool(getattr(self, key_field))
+            for key_field in self._PROVIDER_KEY_FIELDS.values()
+            if key_field is not None
+        )
 
     class Config:
+        # .env is loaded into os.environ once by api.main (src modules read os.environ too)
         case_sensitive = True
-        env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings (parsed once, then cached)
+
+    Use get_settings.cache_clear() to force a reload (e.g. in tests).
+    """
+    return Settings()
@@ -6,21 +6,56 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables FIRST before any other imports
+# Load environment variables FIRST before any other imports (existing env vars win)
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
+os.environ['BACKEND_ENV_LOADED'] = '1'  # src.chatbot skips its standalone .env load
 
 # Disable Google Cloud ADC check - use API key instead
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = ''  # Disable ADC
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.core.config import settings
+from fastapi.responses import ORJSONResponse
+from api.core.config import get_settings
 from api.routes import products, chat
+from api.services.chat_service import get_chat_service
+from api.services.product_service import get_product_service
+from src.utils.redis_manager import RedisManager
+import asyncio
+import logging
+import logging.handlers
+import queue
 import sys
 
+
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue so handler I/O runs on a background thread
+
+    The root level comes from LOG_LEVEL (default INFO); WARNING in production keeps the
+    scrapers' per-review/per-image debug logging from even being formatted.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+log_listener = _configure_logging()
+settings = get_settings()
+
 # Validate LLM configuration at startup (CRITICAL - fail fast)
-if not settings.has_llm_configured():
+if not settings.has_llm_configured:
     print("=" * 80)
     print("❌ ERROR: No LLM provider configured!")
     print("=" * 80)
@@ -37,19 +72,36 @@ if not settings.has_llm_configured():
 
 print(f"✓ LLM Provider: {settings.LLM_PROVIDER}")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm shared services on startup and release the Redis pool on shutdown"""
+    # Build the orchestrator (Redis handshake, LLM clients) off the event loop
+    app.state.product_service = await asyncio.to_thread(get_product_service)
+    app.state.chat_service = get_chat_service()
+    yield
+    RedisManager.close()
+    log_listener.stop()
+
+
+# API v1 prefix, resolved once for the docs URLs and router mounts
+V1 = settings.API_V1_STR
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    docs_url=f"{settings.API_V1_STR}/docs",
-    redoc_url=f"{settings.API_V1_STR}/redoc"
+    openapi_url=f"{V1}/openapi.json",
+    docs_url=f"{V1}/docs",
+    redoc_url=f"{V1}/redoc"
 )
 
-# Configure CORS
+# Configure CORS (origin regex is compiled once by CORSMiddleware)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origin_regex=settings.BACKEND_CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -70,22 +122,28 @@ async def health_check():
 # Include routers
 app.include_router(
     products.router,
-    prefix=f"{settings.API_V1_STR}/products",
+    prefix=f"{V1}/products",
     tags=["products"]
 )
 
 app.include_router(
     chat.router,
-    prefix=f"{settings.API_V1_STR}/chat",
+    prefix=f"{V1}/chat",
     tags=["chat"]
 )
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    # Auto-reload for local development only (API_RELOAD=false for multi-worker runs)
+    reload = os.getenv("API_RELOAD", "true").lower() in ("1", "true", "yes")
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        reload=reload,
+        workers=None if reload else os.cpu_count()
     )
@@ -85,6 +85,29 @@ class ProductData(BaseModel):
     red_flags: Optional[List[str]] = None  # Added missing field
     external_reviews_summary: Optional[str] = None  # Added missing field
 
+    @classmethod
+    def from_validated(cls, data: Dict[str, Any]) -> "ProductData":
+        """
+        Rebuild ProductData from a previously validated model_dump() without re-validating
+
+        Trust boundary: only pass payloads produced by model_dump() of a validated
+        ProductData (e.g. our own validated cache entries), never raw scraped data.
+
+        Args:
+            data: Output of ProductData.model_dump(mode="json")
+
+        Returns:
+            ProductData instance
+        """
+        price_comparison = data.get("price_comparison")
+        return cls.model_construct(**{
+            **data,
+            "reviews": [Review.model_construct(**r) for r in data.get("reviews", [])],
+            "bank_offers": [BankOffer.model_construct(**o) for o in data.get("bank_offers", [])],
+            "competitor_prices": [CompetitorPrice.model_construct(**c) for c in data.get("competitor_prices", [])],
+            "price_comparison": PriceComparison.model_construct(**price_comparison) if price_comparison else None,
+        })
+
 
 # Request Models
 class ScrapeRequest(BaseModel):
@@ -128,7 +151,7 @@ class ChatMessage(BaseModel):
 
 
 class ChatHistoryResponse(BaseModel):
-    """Response with chat history"""
+    """Response with chat history (last MAX_HISTORY messages, oldest first)"""
     success: bool
     message: str
     history: List[ChatMessage] = []
@@ -2,31 +2,40 @@
 Chat routes - Q&A interactions
 """
 
-from fastapi import APIRouter, HTTPException
+import logging
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from api.models.schemas import (
     ChatRequest,
     ClearChatRequest,
     ChatResponse,
     ChatHistoryResponse,
 )
-from api.services.chat_service import chat_service
+from api.services.chat_service import ChatService, get_chat_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
 @router.post("/ask", response_model=ChatResponse)
-async def ask_question(request: ChatRequest):
+async def ask_question(
+    request: ChatRequest,
+    chat_service: ChatService = Depends(get_chat_service)
+):
     """
     Ask a question about a product
 
     Args:
         request: ChatRequest with session_id, product_id (ASIN), and question
+        chat_service: Injected ChatService
 
     Returns:
         ChatResponse with answer
     """
     try:
-        answer = chat_service.ask_question(
+        answer = await chat_service.ask_question(
             session_id=request.session_id,
             product_id=request.product_id,
             question=request.question
@@ -39,28 +48,74 @@ async def ask_question(request: ChatRequest):
         )
 
     except ValueError as e:
-        print(f"❌ Chat ValueError: {str(e)}")
+        logger.warning("Chat ValueError: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"❌ Chat Exception: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chat Exception: %s", e)
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
 
+@router.post("/ask/stream")
+async def ask_question_stream(
+    request: ChatRequest,
+    chat_service: ChatService = Depends(get_chat_service)
+):
+    """
+    Ask a question about a product and stream the answer as Server-Sent Events
+
+    Each chunk is sent as `data: {"token": "..."}`. The stream finishes with an
+    `end` event, or an `error` event if the agent fails mid-answer.
+
+    Args:
+        request: ChatRequest with session_id, product_id (ASIN), and question
+        chat_service: Injected ChatService
+
+    Returns:
+        text/event-stream StreamingResponse
+    """
+    try:
+        tokens = await chat_service.ask_question_stream(
+            session_id=request.session_id,
+            product_id=request.product_id,
+            question=request.question
+        )
+    except ValueError as e:
+        logger.warning("Chat ValueError: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def event_stream():
+        try:
+            async for token in tokens:
+                yield b"data: " + orjson.dumps({"token": token}) + b"\n\n"
+            yield b"event: end\ndata: {}\n\n"
+        except Exception as e:
+            logger.exception("Chat stream Exception: %s", e)
+            yield b"event: error\ndata: " + orjson.dumps({"detail": str(e)}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.get("/history/{session_id}", response_model=ChatHistoryResponse)
-async def get_chat_history(session_id: str):
+async def get_chat_history(
+    session_id: str,
+    chat_service: ChatService = Depends(get_chat_service)
+):
     """
     Get chat history for a session
 
     Args:
         session_id: User session ID
+        chat_service: Injected ChatService
 
     Returns:
         ChatHistoryResponse with message history
     """
     try:
-        history = chat_service.get_chat_history(session_id)
+        history = await chat_service.get_chat_history(session_id)
 
         return ChatHistoryResponse(
             success=True,
@@ -2,19 +2,38 @@
 Product routes - scraping and analysis endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from api.models.schemas import (
     ScrapeRequest,
     AnalysisResponse,
     ProductData,
 )
-from api.services.product_service import product_service
+from api.services.product_service import ProductService, get_product_service
 
 router = APIRouter()
 
+# Clients may reuse a response for this long before revalidating with If-None-Match
+CACHE_CONTROL = "max-age=300"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
 
 @router.post("/scrape-and-analyze", response_model=AnalysisResponse)
-async def scrape_and_analyze_product(request: ScrapeRequest):
+async def scrape_and_analyze_product(
+    request: ScrapeRequest,
+    http_request: Request,
+    product_service: ProductService = Depends(get_product_service)
+):
     """
     UNIFIED: Complete pipeline with parallel execution + intelligent caching
 
@@ -32,11 +51,15 @@ async def scrape_and_analyze_product(request: ScrapeRequest):
     Caching Strategy:
     - First call: Full scraping + analysis (~30-60 seconds)
     - Subsequent calls: Instant response from cache (<1 second)
-    - Cache keys: product:{asin} and product:{asin}:analysis
+    - Repeat calls for the same URL return the cached response body verbatim
+    - Repeat calls carrying a matching If-None-Match get 304 Not Modified (no body)
+    - Cache keys: product:{asin}, product:{asin}:analysis and response_cache:{url_hash}[:etag]
     - TTL: 24 hours for both data and analysis
 
     Args:
         request: ScrapeRequest with product URL and optional flags
+        http_request: Raw HTTP request (for If-None-Match)
+        product_service: Injected ProductService
 
     Returns:
         AnalysisResponse with structured data and analysis
@@ -45,18 +68,47 @@ async def scrape_and_analyze_product(request: ScrapeRequest):
         # Convert HttpUrl to string
         url = str(request.url)
 
+        # Fast path: serve the previously serialized response without re-encoding
+        # (Redis round-trips run off the event loop, like the workflow itself)
+        cached = await asyncio.to_thread(product_service.get_cached_response, url)
+        if cached is not None:
+            cached_body, etag = cached
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            if _etag_matches(http_request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=cached_body, media_type="application/json", headers=headers)
+
         # Run unified LangGraph workflow (parallel execution + analysis)
-        result = product_service.scrape_and_analyze_unified(url=url)
+        result = await product_service.scrape_and_analyze_unified(url=url)
 
         structured_data = result.get('structured_data', {})
         analysis = result.get('analysis', '')
 
-        return AnalysisResponse(
+        # Payloads tagged by the service were already validated - skip re-validation
+        if not structured_data:
+            product_data = None
+        elif structured_data.pop('_validated', False):
+            product_data = ProductData.from_validated(structured_data)
+        else:
+            product_data = ProductData.model_validate(structured_data)
+
+        response = ORJSONResponse(content=AnalysisResponse(
             success=True,
             message="Product scraped and analyzed successfully (with parallel execution)",
             analysis=analysis,
-            product_data=ProductData(**structured_data) if structured_data else None
-        )
+            product_data=product_data
+        ).model_dump(mode="json"))
+
+        # Only cache complete responses so a failed analysis is retried next time
+        if product_data and analysis:
+            etag = product_service.compute_etag(response.body)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = CACHE_CONTROL
+            await asyncio.to_thread(
+                product_service.cache_response, url, product_data.product_id, response.body, etag
+            )
+
+        return response
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
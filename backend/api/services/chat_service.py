@@ -2,13 +2,16 @@
 Chat service - wraps chatbot
 """
 
-import sys
-from pathlib import Path
+import asyncio
+from functools import lru_cache
+from typing import AsyncIterator
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.utils.redis_manager import CHAT_HISTORY_KEY_PREFIX, get_redis_client
+from api.core.config import get_settings
+import orjson
 
-from src.chatbot import ProductChatbot
+# LangChain message types -> ChatMessage roles
+_ROLE_BY_TYPE = {"human": "user", "ai": "assistant"}
 
 
 class ChatService:
@@ -23,6 +26,8 @@ class ChatService:
         """Lazy initialization of chatbot"""
         if self._chatbot is None:
             try:
+                # Imported here so the agent/tool stack loads on first chat use, not at startup
+                from src.chatbot import ProductChatbot
                 self._chatbot = ProductChatbot()
             except Exception as e:
                 print(f"Error initializing chatbot: {str(e)}")
@@ -31,7 +36,7 @@ class ChatService:
                 raise ValueError(f"Chatbot initialization failed: {str(e)}")
         return self._chatbot
 
-    def ask_question(self, session_id: str, product_id: str, question: str) -> str:
+    async def ask_question(self, session_id: str, product_id: str, question: str) -> str:
         """
         Ask a question about a product
 
@@ -47,26 +52,57 @@ class ChatService:
             ValueError: If chatbot not available
             Exception: If query fails
         """
-        answer = self.chatbot.ask(session_id, product_id, question)
+        answer = await self.chatbot.ask(session_id, product_id, question)
         return answer
 
-    def get_chat_history(self, session_id: str) -> list:
+    async def ask_question_stream(self, session_id: str, product_id: str, question: str) -> AsyncIterator[str]:
         """
-        Get chat history for a session
+        Ask a question about a product and stream the answer
 
         Args:
             session_id: User session ID
+            product_id: Product ASIN
+            question: User's question
 
         Returns:
-            List of message dictionaries
+            Async iterator of answer text chunks
+
+        Raises:
+            ValueError: If chatbot not available or product not analyzed
+        """
+        return await self.chatbot.ask_stream(session_id, product_id, question)
 
-        Note:
-            Chat history is managed by LangChain's RedisChatMessageHistory
+    async def get_chat_history(self, session_id: str) -> list:
         """
-        # Chat history is managed internally by LangChain
-        # Frontend maintains display history
-        return []
+        Get the most recent chat history for a session
 
+        Reads at most settings.MAX_HISTORY messages straight from the list kept by
+        LangChain's RedisChatMessageHistory (newest first) so the response size is
+        bounded regardless of conversation length.
 
-# Singleton instance
-chat_service = ChatService()
+        Args:
+            session_id: User session ID
+
+        Returns:
+            List of {'role', 'content'} dictionaries, oldest first
+        """
+        limit = get_settings().MAX_HISTORY
+        # Blocking Redis round-trip; keep it off the event loop
+        raw_messages = await asyncio.to_thread(
+            get_redis_client().lrange, f"{CHAT_HISTORY_KEY_PREFIX}{session_id}", 0, limit - 1
+        )
+
+        history = []
+        for raw in reversed(raw_messages):
+            message = orjson.loads(raw)
+            role = _ROLE_BY_TYPE.get(message.get("type"))
+            content = message.get("data", {}).get("content")
+            if role and isinstance(content, str):
+                history.append({"role": role, "content": content})
+        return history
+
+
+@lru_cache(maxsize=1)
+def get_chat_service() -> ChatService:
+    """Get the shared ChatService (used as a FastAPI dependency)"""
+    return ChatService()
@@ -2,17 +2,17 @@
 Product service - orchestrates complete product analysis pipeline
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from src.scrapers import ScraperFactory
 from src.workflow_orchestrator import ProductWorkflowOrchestrator
 from src.utils.redis_manager import get_redis_client
-from api.core.config import settings
-import json
+from api.core.config import get_settings
+from api.models.schemas import ProductData
+import orjson
 
 
 class ProductService:
@@ -36,7 +36,7 @@ class ProductService:
         # LLM is validated at server startup, so we can assume it's available
         try:
             self.workflow_orchestrator = ProductWorkflowOrchestrator()
-            print(f"✓ LangGraph workflow orchestrator initialized (LLM: {settings.LLM_PROVIDER})")
+            print(f"✓ LangGraph workflow orchestrator initialized (LLM: {get_settings().LLM_PROVIDER})")
         except Exception as e:
             print(f"❌ CRITICAL: Workflow orchestrator initialization failed: {str(e)}")
             raise
@@ -44,10 +44,13 @@ class ProductService:
         # All services now use the unified LangGraph workflow
         # No legacy endpoints remain
 
-    def scrape_and_analyze_unified(self, url: str) -> dict:
+    async def scrape_and_analyze_unified(self, url: str) -> dict:
         """
         UNIFIED: Complete workflow with parallel execution + LLM analysis
 
+        The blocking workflow (scraping, Serper/LLM calls, Redis) runs in a worker
+        thread so the event loop keeps serving other requests meanwhile.
+
         Workflow:
         1. Check Redis cache first
         2. If NOT cached:
@@ -76,6 +79,18 @@ class ProductService:
             supported = ScraperFactory.get_supported_platforms()
             raise ValueError(f"Invalid URL. Supported platforms: {', '.join(supported)}")
 
+        return await asyncio.to_thread(self._run_workflow, url)
+
+    def _run_workflow(self, url: str) -> dict:
+        """
+        Run the LangGraph workflow and validate its product data (blocking)
+
+        Args:
+            url: Supported product URL
+
+        Returns:
+            Dictionary with 'structured_data' and 'analysis'
+        """
         # Run LangGraph workflow (includes analysis now)
         # Price comparison and web search are automatically enabled if SERPER_API_KEY is set
         result = self.workflow_orchestrator.run(url=url)
@@ -83,11 +98,119 @@ class ProductService:
         if not result.get("success"):
             raise Exception(result.get("error", "Workflow execution failed"))
 
+        structured_data = result.get("data", {})
+        if structured_data:
+            structured_data = self._get_validated_product_data(
+                structured_data,
+                cache_hit=result.get("cache_hit", False)
+            )
+
         return {
-            "structured_data": result.get("data", {}),
+            "structured_data": structured_data,
             "analysis": result.get("analysis", "")
         }
 
+    def _get_validated_product_data(self, product_data: dict, cache_hit: bool) -> dict:
+        """
+        Get the ProductData-validated form of the workflow output
+
+        Validated payloads are cached under product:{id}:validated and tagged with
+        '_validated': True so the route can rebuild the model without re-validating.
+        The copy inherits the remaining TTL of product:{id}, so it never outlives the
+        raw data it was validated from. On a workflow cache hit the validated copy is
+        reused; fresh data is always re-validated and overwrites it.
+
+        Args:
+            product_data: Raw product data from the workflow
+            cache_hit: Whether the workflow served product data from Redis
+
+        Returns:
+            Validated product data dictionary (tagged), or raw data if no product ID
+        """
+        product_id = product_data.get("product_id") or product_data.get("asin")
+        if not product_id:
+            return product_data
+
+        validated_key = f"product:{product_id}:validated"
+
+        if cache_hit:
+            try:
+                cached = self.redis_client.get(validated_key)
+                if cached:
+                    return orjson.loads(cached)
+            except Exception as e:
+                print(f"Redis error: {str(e)}")
+
+        validated = ProductData.model_validate(product_data).model_dump(mode="json")
+        validated["_validated"] = True
+
+        try:
+            ttl = self.redis_client.ttl(f"product:{product_id}")
+            if ttl and ttl > 0:
+                self.redis_client.setex(validated_key, ttl, orjson.dumps(validated))
+        except Exception as e:
+            print(f"Redis error: {str(e)}")
+
+        return validated
+
+    def _response_cache_key(self, url: str) -> str:
+        """Build the response cache key for a product URL"""
+        return f"response_cache:{hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    def get_cached_response(self, url: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the pre-serialized AnalysisResponse JSON and its ETag for a URL
+
+        Args:
+            url: Product URL
+
+        Returns:
+            (body, etag) tuple or None
+        """
+        key = self._response_cache_key(url)
+        try:
+            body, etag = self.redis_client.mget(key, f"{key}:etag")
+        except Exception as e:
+            print(f"Redis error: {str(e)}")
+            return None
+
+        if body is None:
+            return None
+        # Entries cached before ETags were stored get one computed on the fly
+        return body, etag or self.compute_etag(body.encode('utf-8'))
+
+    @staticmethod
+    def compute_etag(body: bytes) -> str:
+        """Build a strong (quoted) ETag from a serialized response body"""
+        return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def cache_response(self, url: str, product_id: Optional[str], body: bytes, etag: str) -> None:
+        """
+        Cache a serialized AnalysisResponse body and its ETag for a URL
+
+        The entries expire together with the underlying product:{id} cache entry
+        so a cached response never outlives the product data it was built from.
+
+        Args:
+            url: Product URL
+            product_id: Product ID the response was built from
+            body: Serialized JSON response body
+            etag: ETag of the body
+        """
+        if not product_id:
+            return
+
+        key = self._response_cache_key(url)
+        try:
+            ttl = self.redis_client.ttl(f"product:{product_id}")
+            if ttl and ttl > 0:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.setex(key, ttl, body)
+                pipe.setex(f"{key}:etag", ttl, etag)
+                pipe.execute()
+        except Exception as e:
+            print(f"Redis error: {str(e)}")
+
     def get_product_from_cache(self, asin: str) -> dict:
         """
         Get product data from Redis cache
@@ -103,7 +226,7 @@ class ProductService:
             data = self.redis_client.get(key)
 
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
 
         except Exception as e:
@@ -111,5 +234,12 @@ class ProductService:
             return None
 
 
-# Singleton instance
-product_service = ProductService()
+@lru_cache(maxsize=1)
+def get_product_service() -> ProductService:
+    """
+    Get the shared ProductService (created on first use)
+
+    Used as a FastAPI dependency so the orchestrator and Redis client are
+    built on first request instead of at import time.
+    """
+    return ProductService()
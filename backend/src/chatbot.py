@@ -5,26 +5,99 @@ Includes web search capability via LangChain tools
 Supports multiple LLM providers via environment configuration
 """
 
-import json
+import asyncio
+import hashlib
 import os
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
 from pathlib import Path
+import orjson
 import redis
 from dotenv import load_dotenv
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationBufferWindowMemory
 
-# Load environment variables from .env file
-# Find the .env file in the backend directory
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path, override=True)
+# Load environment variables from the backend .env file when used standalone;
+# under the API, main.py has already loaded it (existing env vars win either way)
+if not os.getenv('BACKEND_ENV_LOADED'):
+    env_path = Path(__file__).parent.parent / '.env'
+    load_dotenv(dotenv_path=env_path)
 
 from src.llm_provider import get_llm
+from src.utils.redis_manager import CHAT_HISTORY_KEY_PREFIX, get_redis_client
 from langchain_community.chat_message_histories import RedisChatMessageHistory
-from langchain_community.utilities import GoogleSerperAPIWrapper
-from langchain_community.tools import DuckDuckGoSearchResults
 from langchain.tools import Tool
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.agents import create_tool_calling_agent, AgentExecutor
+from langchain_core.agents import AgentStep
+from pydantic import PrivateAttr
+
+
+# Competitor fields kept for the chatbot context (defaults for missing keys)
+_COMPETITOR_DEFAULTS = {'site': 'Unknown', 'price': 'N/A', 'availability': 'Unknown', 'url': ''}
+_competitor_fields = itemgetter('site', 'price', 'availability', 'url')
+
+# Agent loop limits per question (LLM turns / wall-clock seconds)
+AGENT_MAX_ITERS = int(os.getenv("AGENT_MAX_ITERS", "5"))
+AGENT_MAX_EXECUTION_TIME = 30.0
+
+# Question/answer exchanges replayed into the agent prompt
+CHAT_WINDOW = int(os.getenv("CHAT_WINDOW", "8"))
+
+# Search tool results are cached in Redis and shared across sessions
+SEARCH_CACHE_TTL = 3600  # 1 hour
+
+
+@lru_cache(maxsize=1)
+def get_serper_wrapper():
+    """Get the shared Serper API wrapper (imported and created on first use)"""
+    from langchain_community.utilities import GoogleSerperAPIWrapper
+    return GoogleSerperAPIWrapper()
+
+
+class SharedRedisChatMessageHistory(RedisChatMessageHistory):
+    """
+    RedisChatMessageHistory backed by an existing Redis client
+
+    The stock class opens a new client (and connection pool) per instance, i.e.
+    per chat message. The client must not decode responses: the base class
+    decodes the stored bytes itself.
+    """
+
+    def __init__(self, session_id: str, redis_client: redis.Redis, key_prefix: str = CHAT_HISTORY_KEY_PREFIX, ttl: Optional[int] = None):
+        # Base __init__ is skipped on purpose - it would create its own client
+        self.redis_client = redis_client
+        self.session_id = session_id
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor with bounded, safety-aware parallel tool execution
+
+    The async agent loop gathers every tool call from one LLM turn concurrently.
+    Calls to tools marked metadata={"is_concurrency_safe": True} share
+    max_concurrency slots; any other tool takes an exclusive lock so unsafe tools
+    never overlap each other.
+    """
+
+    max_concurrency: int = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "5"))
+
+    _semaphore: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
+    _exclusive: Optional[asyncio.Lock] = PrivateAttr(default=None)
+
+    async def _aperform_agent_action(self, name_to_tool_map, color_mapping, agent_action, run_manager=None) -> AgentStep:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            self._exclusive = asyncio.Lock()
+
+        tool = name_to_tool_map.get(agent_action.tool)
+        is_safe = bool(tool and (tool.metadata or {}).get("is_concurrency_safe"))
+        async with (self._semaphore if is_safe else self._exclusive):
+            return await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+
 
 class ProductChatbot:
 
@@ -43,14 +116,19 @@ class ProductChatbot:
         # Store Redis connection details for creating session-specific message histories
         self.redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}" if redis_password else f"redis://{redis_host}:{redis_port}/{redis_db}"
 
-        # Simple Redis client for product data storage (common across all sessions)
-        self.redis_client = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            db=redis_db,
-            password=redis_password,
-            decode_responses=True
-        )
+        # One pool, parsed from the URL once, shared by every session's message history
+        # (bytes mode: RedisChatMessageHistory decodes stored entries itself)
+        self._history_pool = redis.ConnectionPool.from_url(self.redis_url, max_connections=32)
+        self.history_redis_client = redis.Redis(connection_pool=self._history_pool)
+
+        # Shared pooled Redis client for product data storage (common across all sessions)
+        self.redis_client = get_redis_client()
+
+        # Set when the speculative first search is enabled (Serper only)
+        self._speculative_search = None
+
+        # Cache key -> task of a search currently running (identical queries share it)
+        self._inflight_searches: Dict[str, asyncio.Task] = {}
 
         # Initialize search tool based on SEARCH_PROVIDER env variable
         search_provider = os.getenv('SEARCH_PROVIDER', 'duckduckgo').lower()
@@ -58,39 +136,54 @@ class ProductChatbot:
         if search_provider == 'serper':
             # Use Serper API (requires SERPER_API_KEY)
             try:
-                search = GoogleSerperAPIWrapper()
+                search = get_serper_wrapper()
 
-                def search_with_urls(query: str) -> str:
-                    """Search using Serper API and return results with URLs"""
-                    try:
-                        results = search.results(query)
-                        formatted_results = []
+                def format_results(results: Dict) -> str:
+                    """Format Serper organic/video results with their URLs"""
+                    formatted_results = []
 
-                        if 'organic' in results:
-                            for result in results['organic'][:5]:
-                                title = result.get('title', '')
-                                link = result.get('link', '')
-                                snippet = result.get('snippet', '')
-                                formatted_results.append(f"Title: {title}\nURL: {link}\nSnippet: {snippet}\n")
+                    if 'organic' in results:
+                        for result in results['organic'][:5]:
+                            title = result.get('title', '')
+                            link = result.get('link', '')
+                            snippet = result.get('snippet', '')
+                            formatted_results.append(f"Title: {title}\nURL: {link}\nSnippet: {snippet}\n")
 
-                        if 'videos' in results:
-                            for video in results['videos'][:5]:
-                                title = video.get('title', '')
-                                link = video.get('link', '')
-                                formatted_results.append(f"Video: {title}\nURL: {link}\n")
+                    if 'videos' in results:
+                        for video in results['videos'][:5]:
+                            title = video.get('title', '')
+                            link = video.get('link', '')
+                            formatted_results.append(f"Video: {title}\nURL: {link}\n")
 
-                        if not formatted_results:
-                            return search.run(query)
+                    return "\n".join(formatted_results)
 
-                        return "\n".join(formatted_results)
+                def search_with_urls(query: str) -> str:
+                    """Search using Serper API and return results with URLs"""
+                    try:
+                        return format_results(search.results(query)) or search.run(query)
+                    except Exception as e:
+                        return f"Search error: {str(e)}"
 
+                async def asearch_with_urls(query: str) -> str:
+                    """Async Serper search (aiohttp)"""
+                    try:
+                        return format_results(await search.aresults(query)) or await search.arun(query)
                     except Exception as e:
                         return f"Search error: {str(e)}"
 
+                cached_asearch = self._cached_asearch(asearch_with_urls)
+
+                # Opt-in: start searching the raw question while the LLM plans its first step;
+                # an identical agent query then joins the in-flight search or hits the cache
+                if os.getenv('CHAT_SPECULATIVE_SEARCH', 'false').lower() in ('1', 'true', 'yes'):
+                    self._speculative_search = cached_asearch
+
                 search_tool = Tool(
                     name="Search",
                     description="Useful for searching the internet for current information about products, prices, availability, comparisons, or any up-to-date information. Input should be a search query string. Returns results with URLs.",
-                    func=search_with_urls
+                    func=self._cached_search(search_with_urls),
+                    coroutine=cached_asearch,
+                    metadata={"is_concurrency_safe": True}  # stateless HTTP call
                 )
                 print("✓ Search tool: Serper (Google)")
 
@@ -125,10 +218,13 @@ class ProductChatbot:
             search_tool = Tool(
                 name="Search",
                 description="Useful for searching the internet for current information about products, prices, availability, comparisons, or any up-to-date information. Input should be a search query string. Returns results with URLs.",
-                func=ddg_search
+                func=self._cached_search(ddg_search),
+                coroutine=self._cached_asearch(partial(asyncio.to_thread, ddg_search)),
+                metadata={"is_concurrency_safe": True}  # stateless HTTP call
             )
             print("✓ Search tool: DuckDuckGo (free)")
 
+        self.search_provider = search_provider
         self.tools = [search_tool]
 
         # Load system prompt template
@@ -142,10 +238,38 @@ class ProductChatbot:
                 "Please ensure config/prompts/agent_prompt.txt exists."
             )
 
-    def ask(self, session_id: str, product_id: str, question: str) -> str:
+        # Prompt and agent are built once; product data is a per-call prompt variable.
+        # Literal braces in the template are escaped so only {product_data} is a variable.
+        system_template = (
+            self.system_prompt_template
+            .replace('{', '{{').replace('}', '}}')
+            .replace('<<PRODUCT_DATA>>', '{product_data}')
+        )
+        system_prompt = ("system", system_template)
+        if os.getenv('LLM_PROVIDER', 'google').lower() == 'anthropic':
+            # Anthropic only reuses prompt prefixes that are explicitly marked; the system
+            # prompt (instructions + product JSON) is identical across a product's turns.
+            # Gemini/OpenAI cache repeated prefixes implicitly, so no marker is needed.
+            system_prompt = ("system", [
+                {"type": "text", "text": system_template, "cache_control": {"type": "ephemeral"}}
+            ])
+
+        self._prompt = ChatPromptTemplate.from_messages([
+            system_prompt,
+            MessagesPlaceholder(variable_name="chat_history"),
+            ("human", "{input}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ])
+        self._agent = create_tool_calling_agent(self.llm, self.tools, self._prompt)
+
+    async def ask(self, session_id: str, product_id: str, question: str) -> str:
         """
         Ask a question about a product
 
+        Tool calls from one LLM turn run concurrently on the event loop. With
+        CHAT_SPECULATIVE_SEARCH enabled, a search for the question itself starts
+        immediately; if the agent issues the same query it joins that search.
+
         Args:
             session_id: Session ID for conversation history
             product_id: Product ID (e.g., ASIN or URL hash) to fetch product data
@@ -154,74 +278,187 @@ class ProductChatbot:
         Returns:
             Answer string
         """
-        # Get product data from Redis using product_id (common for all sessions)
-        product_data = self.get_product_data(product_id)
-        if not product_data:
-            raise ValueError("Please analyze a product first before asking questions.")
-
-        # Clean product data - remove Google Shopping URLs and keep only direct URLs
-        # cleaned_data = self._clean_product_data(product_data)
-        product_data_json = json.dumps(product_data, indent=2, ensure_ascii=False)
+        product_data_json = self._load_product_json(product_id)
 
         # Generate answer using modern LangChain agent
         try:
-            chat_histroy = RedisChatMessageHistory(
-                session_id=session_id,
-                url=self.redis_url,
-            )
-            memory = ConversationBufferMemory(
-                memory_key="chat_history",  # must match your prompt's variable name
-                chat_memory=chat_histroy,
-                return_messages=True  # recommended for agent chat
-            )
-
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", self._get_system_prompt(product_data_json)),
-                MessagesPlaceholder(variable_name="chat_history"),
-                ("human", "{input}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-
-            ])
-
-            agent = create_tool_calling_agent(self.llm, self.tools, prompt)
-
-            agent_executor = AgentExecutor(
-                agent=agent,
-                tools=self.tools,
-                memory=memory,
-                verbose=True,
-                handle_parsing_errors=True,
-                max_iterations=10,
-            )
+            agent_executor = self._build_agent_executor(session_id)
 
             # Invoke agent
-            result = agent_executor.invoke({"input": question})
+            async with self._speculation(question):
+                result = await agent_executor.ainvoke({"input": question, "product_data": product_data_json})
             answer = result.get('output', '').strip()
 
             return answer
 
         except Exception as e:
-            error_msg = str(e)
-            # Check if it's a Google API internal error (temporary)
-            if "500" in error_msg and "internal error" in error_msg.lower():
-                raise Exception("The AI service is temporarily unavailable. Please try asking your question again in a moment.")
-            raise Exception(f"Failed to generate answer: {error_msg}")
+            raise self._answer_error(e)
 
-    def _get_system_prompt(self, product_data_json: str) -> str:
+    async def ask_stream(self, session_id: str, product_id: str, question: str) -> AsyncIterator[str]:
         """
-        Get formatted system prompt with product data
+        Ask a question about a product and stream the answer tokens
+
+        Validation (product analyzed?) happens before this returns, so callers can
+        report it before starting a streaming response.
 
         Args:
-            product_data_json: Product data in JSON format
+            session_id: Session ID for conversation history
+            product_id: Product ID (e.g., ASIN or URL hash) to fetch product data
+            question: User's question
 
         Returns:
-            Formatted system prompt string
+            Async iterator of answer text chunks as the LLM generates them
+
+        Raises:
+            ValueError: If the product has not been analyzed yet
+        """
+        product_data_json = self._load_product_json(product_id)
+        return self._stream_answer(session_id, product_data_json, question)
+
+    async def _stream_answer(self, session_id: str, product_data_json: str, question: str) -> AsyncIterator[str]:
+        """Yield LLM text chunks from the agent run (tool-call chunks carry no text)"""
+        try:
+            agent_executor = self._build_agent_executor(session_id)
+            inputs = {"input": question, "product_data": product_data_json}
+
+            async with self._speculation(question):
+                async for event in agent_executor.astream_events(inputs, version="v2"):
+                    if event["event"] == "on_chat_model_stream":
+                        content = event["data"]["chunk"].content
+                        if content and isinstance(content, str):
+                            yield content
+
+        except Exception as e:
+            raise self._answer_error(e)
+
+    def _load_product_json(self, product_id: str) -> str:
         """
-        # Escape braces for prompt template formatting
-        product_data_escaped = product_data_json.replace('{', '{{').replace('}', '}}')
+        Load the product data JSON for the prompt
 
-        # Replace placeholder with actual product data
-        return self.system_prompt_template.replace('<<PRODUCT_DATA>>', product_data_escaped)
+        The cached value is already compact JSON (written by the workflow with
+        orjson), so it is used verbatim: no parse/re-serialize pass.
+
+        Raises:
+            ValueError: If the product has not been analyzed yet
+        """
+        # Get product data from Redis using product_id (common for all sessions)
+        # Clean product data - remove Google Shopping URLs and keep only direct URLs
+        # cleaned_data = self._clean_product_data(product_data)
+        product_data_json = self.redis_client.get(f"product:{product_id}")
+        if not product_data_json:
+            raise ValueError("Please analyze a product first before asking questions.")
+        return product_data_json
+
+    def _build_agent_executor(self, session_id: str) -> "ParallelToolAgentExecutor":
+        """Wrap the shared agent in an executor with the session's Redis-backed memory"""
+        chat_histroy = SharedRedisChatMessageHistory(
+            session_id=session_id,
+            redis_client=self.history_redis_client,
+        )
+        # Full history stays in Redis; only the last CHAT_WINDOW exchanges reach the prompt
+        memory = ConversationBufferWindowMemory(
+            k=CHAT_WINDOW,
+            memory_key="chat_history",  # must match your prompt's variable name
+            input_key="input",  # product_data is also an input, but not part of history
+            chat_memory=chat_histroy,
+            return_messages=True  # recommended for agent chat
+        )
+
+        # Independent Search calls from the same turn run concurrently
+        return ParallelToolAgentExecutor(
+            agent=self._agent,
+            tools=self.tools,
+            memory=memory,
+            verbose=True,
+            # Bound worst-case LLM round-trips on misbehaving outputs
+            handle_parsing_errors="Invalid tool call format. Respond with a direct answer instead.",
+            max_iterations=AGENT_MAX_ITERS,
+            max_execution_time=AGENT_MAX_EXECUTION_TIME,
+            # "generate" is not supported by tool-calling (multi-action) agents
+            early_stopping_method="force",
+        )
+
+    @asynccontextmanager
+    async def _speculation(self, question: str):
+        """Run the optional speculative search for the duration of one agent run"""
+        if self._speculative_search is None:
+            yield
+            return
+
+        # The underlying search is shielded, so cancelling only stops waiting for it
+        speculative_task = asyncio.create_task(self._speculative_search(question))
+        try:
+            yield
+        finally:
+            speculative_task.cancel()
+
+    def _search_cache_key(self, query: str) -> str:
+        """Build the Redis key for a search query (case/whitespace-insensitive)"""
+        normalized = " ".join(query.lower().split())
+        digest = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+        return f"search:{self.search_provider}:{digest}"
+
+    def _get_cached_search(self, key: str) -> Optional[str]:
+        try:
+            return self.redis_client.get(key)
+        except Exception as e:
+            print(f"Redis error: {str(e)}")
+            return None
+
+    def _set_cached_search(self, key: str, result: str) -> None:
+        # Failed searches are not cached so the next call retries
+        if result.startswith("Search error"):
+            return
+        try:
+            self.redis_client.setex(key, SEARCH_CACHE_TTL, result)
+        except Exception as e:
+            print(f"Redis error: {str(e)}")
+
+    def _cached_search(self, search_func: Callable[[str], str]) -> Callable[[str], str]:
+        """Wrap a search function with the Redis TTL cache"""
+        def cached_search(query: str) -> str:
+            key = self._search_cache_key(query)
+            result = self._get_cached_search(key)
+            if result is None:
+                result = search_func(query)
+                self._set_cached_search(key, result)
+            return result
+
+        return cached_search
+
+    def _cached_asearch(self, asearch_func: Callable[[str], Awaitable[str]]) -> Callable[[str], Awaitable[str]]:
+        """Wrap an async search function with the Redis TTL cache and in-flight coalescing"""
+        # The Redis get/setex are blocking round-trips; run them off the event loop so
+        # concurrently running tools are not stalled behind them
+        async def fetch(key: str, query: str) -> str:
+            result = await asearch_func(query)
+            await asyncio.to_thread(self._set_cached_search, key, result)
+            return result
+
+        async def cached_asearch(query: str) -> str:
+            key = self._search_cache_key(query)
+            result = await asyncio.to_thread(self._get_cached_search, key)
+            if result is not None:
+                return result
+
+            task = self._inflight_searches.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fetch(key, query))
+                self._inflight_searches[key] = task
+                task.add_done_callback(lambda _: self._inflight_searches.pop(key, None))
+            # Shielded: one caller being cancelled must not cancel the shared search
+            return await asyncio.shield(task)
+
+        return cached_asearch
+
+    @staticmethod
+    def _answer_error(e: Exception) -> Exception:
+        """Map an agent failure to the user-facing exception"""
+        error_msg = str(e)
+        # Check if it's a Google API internal error (temporary)
+        if "500" in error_msg and "internal error" in error_msg.lower():
+            return Exception("The AI service is temporarily unavailable. Please try asking your question again in a moment.")
+        return Exception(f"Failed to generate answer: {error_msg}")
 
     def _clean_product_data(self, product_data: Dict) -> Dict:
         """
@@ -233,20 +470,20 @@ class ProductChatbot:
         Returns:
             Cleaned product data optimized for chatbot use
         """
-        import copy
-        cleaned = copy.deepcopy(product_data)
+        # Shallow copy - nested values (reviews etc.) are read-only downstream,
+        # only the two rebuilt keys below get new objects
+        cleaned = {k: v for k, v in product_data.items() if k != 'price_comparison'}
 
         # Simplify competitor_prices - remove Google redirect URLs but keep price info
-        if 'competitor_prices' in cleaned:
+        if 'competitor_prices' in product_data:
             simplified_competitors = []
-            for competitor in cleaned['competitor_prices']:
-                simplified = {
-                    'site': competitor.get('site', 'Unknown'),
-                    'price': competitor.get('price', 'N/A'),
-                    'availability': competitor.get('availability', 'Unknown')
-                }
+            competitor_fields = map(
+                _competitor_fields,
+                ({**_COMPETITOR_DEFAULTS, **competitor} for competitor in product_data['competitor_prices'])
+            )
+            for site, price, availability, url in competitor_fields:
+                simplified = {'site': site, 'price': price, 'availability': availability}
                 # Only add URL if it's a direct product URL (not Google Shopping search)
-                url = competitor.get('url', '')
                 if url and not url.startswith('https://www.google.com/search'):
                     simplified['url'] = url
 
@@ -255,18 +492,16 @@ class ProductChatbot:
             cleaned['competitor_prices'] = simplified_competitors
 
         # Simplify price_comparison to just essential summary data
-        if 'price_comparison' in cleaned:
-            price_comp = cleaned['price_comparison']
+        # (the full object is left out above to reduce context size)
+        price_comp = product_data.get('price_comparison')
+        if isinstance(price_comp, dict):
             # Keep only the summary, remove raw search results
-            if isinstance(price_comp, dict):
-                cleaned['price_comparison_summary'] = {
-                    'total_results': price_comp.get('total_results', 0),
-                    'lowest_price': price_comp.get('lowest_price'),
-                    'highest_price': price_comp.get('highest_price'),
-                    'current_price': price_comp.get('current_price'),
-                }
-            # Remove the full price_comparison object to reduce context size
-            del cleaned['price_comparison']
+            cleaned['price_comparison_summary'] = {
+                'total_results': price_comp.get('total_results', 0),
+                'lowest_price': price_comp.get('lowest_price'),
+                'highest_price': price_comp.get('highest_price'),
+                'current_price': price_comp.get('current_price'),
+            }
 
         # Add Amazon URL for easy reference
         if 'asin' in cleaned:
@@ -278,6 +513,6 @@ class ProductChatbot:
         key = f"product:{product_id}"
         data = self.redis_client.get(key)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         return None
 
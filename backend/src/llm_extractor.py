@@ -6,11 +6,40 @@ Uses configured LLM provider to intelligently extract ALL product information fr
 import json
 import os
 import re
-from typing import Dict, Optional
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Dict, Optional, Union
+import orjson
+from lxml import etree, html as lxml_html
 from src.llm_provider import get_llm
 from src.utils.prompts import get_product_extraction_prompt
 
+# JSON payload in the LLM response: fenced ```json block first, then any raw {...}
+_JSON_FENCE_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_RAW_RE = re.compile(r'(\{.*\})', re.DOTALL)
+
+# Page text cleanup: runs of 2+ spaces split phrases; blank/indented lines collapse
+_PHRASE_GAP_RE = re.compile(r' {2,}')
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# Visible page text: every text node outside script/style/noscript (tails included)
+_VISIBLE_TEXT = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]',
+    smart_strings=False
+)
+
+# Page text budget sent to the LLM (~50K characters of English text)
+MAX_INPUT_TOKENS = 12500
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Get the tiktoken cl100k_base encoding, or None if tiktoken is not installed"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
 
 class LLMProductExtractor:
     """Uses LLM to extract comprehensive product data from HTML content"""
@@ -28,36 +57,67 @@ class LLMProductExtractor:
             temperature=0.1  # Low temperature for factual extraction
         )
 
-    def clean_html_to_text(self, soup: BeautifulSoup) -> str:
+    def clean_html_to_text(self, html: Union[str, bytes, lxml_html.HtmlElement]) -> str:
         """
-        Convert BeautifulSoup object to clean text, removing all HTML elements
+        Convert raw HTML to clean text, removing all HTML elements
+
+        Parses with lxml's C parser directly (no BeautifulSoup tree walk).
 
         Args:
-            soup: BeautifulSoup object
+            html: Raw page HTML (bytes preferred, so lxml can honour the page charset),
+                or an already-parsed lxml tree (left unmodified)
 
         Returns:
             Clean text content
         """
-        # Remove script and style elements
-        for script in soup(["script", "style", "noscript"]):
-            script.decompose()
+        if isinstance(html, etree._Element):
+            tree = html
+        else:
+            try:
+                tree = lxml_html.fromstring(html)
+            except (etree.ParserError, ValueError):
+                return ""
+
+        # Get text, skipping script and style elements
+        text = ''.join(_VISIBLE_TEXT(tree))
+
+        # Clean up whitespace: double spaces separate phrases, one phrase/line per line
+        text = _PHRASE_GAP_RE.sub('\n', text)
+        return _LINE_BREAK_RE.sub('\n', text).strip()
+
+    def _truncate_to_token_budget(self, text: str) -> str:
+        """
+        Truncate text to MAX_INPUT_TOKENS tokens
 
-        # Get text
-        text = soup.get_text()
+        Counts tokens with tiktoken (cl100k_base) when installed; otherwise falls
+        back to the ~4 characters/token approximation.
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        Args:
+            text: Clean page text
 
+        Returns:
+            Text within the token budget
+        """
+        encoding = _get_token_encoding()
+        if encoding is None:
+            max_chars = MAX_INPUT_TOKENS * 4
+            if len(text) > max_chars:
+                print(f"Text truncated to {max_chars} characters")
+                return text[:max_chars]
+            return text
+
+        token_ids = encoding.encode(text, disallowed_special=())
+        if len(token_ids) > MAX_INPUT_TOKENS:
+            print(f"Text truncated to {MAX_INPUT_TOKENS} tokens")
+            return encoding.decode(token_ids[:MAX_INPUT_TOKENS])
         return text
 
-    def extract_product_data(self, soup: BeautifulSoup, url: str) -> Dict:
+    def extract_product_data(self, html: Union[str, bytes, lxml_html.HtmlElement], url: str) -> Dict:
         """
         Extract comprehensive product data using LLM
 
         Args:
-            soup: BeautifulSoup object from product page
+            html: Raw HTML of the product page, or the scraper's parsed lxml tree
             url: Product URL
 
         Returns:
@@ -65,13 +125,10 @@ class LLMProductExtractor:
         """
         # Clean HTML to text
         print("Cleaning HTML content...")
-        clean_text = self.clean_html_to_text(soup)
+        clean_text = self.clean_html_to_text(html)
 
         # Truncate if too long (to fit within token limits)
-        max_chars = 50000
-        if len(clean_text) > max_chars:
-            clean_text = clean_text[:max_chars]
-            print(f"Text truncated to {max_chars} characters")
+        clean_text = self._truncate_to_token_budget(clean_text)
 
         # Create extraction prompt
         prompt = get_product_extraction_prompt(clean_text, url)
@@ -82,19 +139,19 @@ class LLMProductExtractor:
             result_text = response.content.strip()
 
             # Extract JSON from response (handle markdown code blocks)
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', result_text, re.DOTALL)
+            json_match = _JSON_FENCE_RE.search(result_text)
             if json_match:
                 json_str = json_match.group(1)
             else:
                 # Try to find raw JSON
-                json_match = re.search(r'(\{.*\})', result_text, re.DOTALL)
+                json_match = _JSON_RAW_RE.search(result_text)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = result_text
 
-            # Parse JSON
-            product_data = json.loads(json_str)
+            # Parse JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            product_data = orjson.loads(json_str)
             print("✓ LLM extraction successful")
 
             return product_data
@@ -4,6 +4,7 @@ Supports multiple LLM providers configured via environment variables
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -45,6 +46,9 @@ class LLMFactory:
         """
         Get LLM instance based on configuration
 
+        Instances are shared per (provider, temperature, model, kwargs), so callers
+        must not mutate the returned object.
+
         Args:
             temperature: Temperature for generation (0.0 - 1.0)
             provider: Override provider from env (google, openai, anthropic, etc.)
@@ -69,6 +73,24 @@ class LLMFactory:
                 f"Supported: {', '.join([p.value for p in LLMProvider])}"
             )
 
+        # Reuse one client (and its HTTP connection pool) per configuration
+        try:
+            frozen_kwargs = frozenset(kwargs.items())
+        except TypeError:
+            # Unhashable kwargs (e.g. a callbacks list) - build an uncached instance
+            return LLMFactory._build_llm(provider_enum, temperature, model, **kwargs)
+
+        return LLMFactory._get_cached_llm(provider_enum, temperature, model or os.getenv('LLM_MODEL'), frozen_kwargs)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _get_cached_llm(provider_enum: LLMProvider, temperature: float, model: Optional[str], frozen_kwargs: frozenset):
+        """Build the shared LLM instance for a (provider, temperature, model, kwargs) key"""
+        return LLMFactory._build_llm(provider_enum, temperature, model, **dict(frozen_kwargs))
+
+    @staticmethod
+    def _build_llm(provider_enum: LLMProvider, temperature: float, model: Optional[str] = None, **kwargs):
+        """Construct a new LLM instance for a validated provider"""
         # Route to appropriate provider
         if provider_enum == LLMProvider.GOOGLE:
             return LLMFactory._get_google_llm(temperature, model, **kwargs)
@@ -83,7 +105,7 @@ class LLMFactory:
         elif provider_enum == LLMProvider.COHERE:
             return LLMFactory._get_cohere_llm(temperature, model, **kwargs)
         else:
-            raise ValueError(f"Provider {provider} not implemented")
+            raise ValueError(f"Provider {provider_enum.value} not implemented")
 
     @staticmethod
     def _get_google_llm(temperature: float, model: Optional[str] = None, **kwargs):
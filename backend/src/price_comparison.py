@@ -5,10 +5,173 @@ Compares product prices across Amazon, Flipkart, eBay, Walmart, and other platfo
 
 import os
 import re
-import statistics
-from typing import Dict, List, Tuple, Optional
-from difflib import SequenceMatcher
-from src.utils.search import search_shopping as search_shopping_api
+import string
+import sys
+import threading
+import urllib.parse
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple, Optional
+import numpy as np
+from cachetools import TTLCache
+from src.utils.search import create_http_session, search_shopping as search_shopping_api
+
+
+# Title/price patterns, compiled once (hot path: every result is normalized and compared)
+_STORAGE_RE = re.compile(r'(\d+)\s*(gb|tb)')
+_RAM_RE = re.compile(r'(\d+)\s*gb\s*ram')
+_MODEL_RE = re.compile(r'(pro max|pro|plus|ultra|lite|mini|\d+[a-z]?)')
+_PRICE_CLEAN_RE = re.compile(r'[^\d.]')
+_PLATFORM_RE = re.compile(r'(amazon|flipkart|ebay|walmart|myntra|snapdeal|croma|tata)')
+_GOOGLE_Q_RE = re.compile(r'[?&](q|url)=([^&]+)')
+# Punctuation -> space, so "256GB/8GB" or "Pro-Max" split into word tokens
+_TOKEN_TABLE = str.maketrans({ch: ' ' for ch in string.punctuation})
+_CURRENCY_MAP = {'₹': 'INR', '$': 'USD', '€': 'EUR', '£': 'GBP'}
+
+# Shopping search responses are reused for repeat lookups of the same product
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 600  # seconds
+
+# Brand/color vocabularies in priority order (earlier entries win when several appear)
+_BRANDS = ('apple', 'samsung', 'oneplus', 'xiaomi', 'realme', 'oppo', 'vivo',
+           'google', 'motorola', 'nokia', 'asus', 'sony', 'lg', 'huawei',
+           'iphone', 'galaxy', 'pixel', 'redmi', 'poco')
+_COLORS = ('black', 'white', 'blue', 'red', 'green', 'yellow', 'pink', 'purple',
+           'gold', 'silver', 'grey', 'gray', 'titanium', 'natural', 'midnight',
+           'starlight', 'sierra', 'alpine')
+
+
+def _term_scanner(terms: Tuple[str, ...]) -> Tuple["re.Pattern", Dict[str, int]]:
+    """
+    Build a single-pass scanner for a vocabulary
+
+    The lookahead alternation reports overlapping matches, so one finditer pass
+    sees every term a chain of `term in text` checks would.
+
+    Args:
+        terms: Vocabulary in priority order
+
+    Returns:
+        Tuple of (compiled alternation, term -> priority rank)
+    """
+    alternation = '|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))'), {t: i for i, t in enumerate(terms)}
+
+
+# Attributes compared by _calculate_product_similarity (color is not)
+_SIMILARITY_KEYS = frozenset(('brand', 'storage', 'ram', 'model'))
+_ALL_ATTRIBUTE_KEYS = _SIMILARITY_KEYS | {'color'}
+
+_BRAND_RE, _BRAND_RANK = _term_scanner(_BRANDS)
+_COLOR_RE, _COLOR_RANK = _term_scanner(_COLORS)
+
+
+def _first_listed_term(pattern: "re.Pattern", ranks: Dict[str, int], text: str) -> Optional[str]:
+    """Return the highest-priority vocabulary term found in text, or None"""
+    found = {m.group(1) for m in pattern.finditer(text)}
+    return min(found, key=ranks.__getitem__) if found else None
+
+
+@lru_cache(maxsize=1024)
+def _title_attributes(
+    title_lower: str,
+    keys: FrozenSet[str] = _SIMILARITY_KEYS
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Extract key product attributes from a title (memoized)
+
+    The query title is compared against every result, so caching avoids
+    re-parsing it once per result.
+
+    Args:
+        title_lower: Lowercased product title
+        keys: Attributes to extract; others are skipped (default: those used for similarity)
+
+    Returns:
+        Hashable (attribute, value) pairs (brand, storage, ram, color, model)
+    """
+    attributes = []
+
+    # Extract brand (common brands) in a single scan of the title
+    if 'brand' in keys:
+        brand = _first_listed_term(_BRAND_RE, _BRAND_RANK, title_lower)
+        if brand:
+            attributes.append(('brand', brand))
+
+    # Extract storage capacity (GB, TB)
+    if 'storage' in keys:
+        storage_match = _STORAGE_RE.search(title_lower)
+        if storage_match:
+            attributes.append(('storage', f"{storage_match.group(1)}{storage_match.group(2)}"))
+
+    # Extract RAM
+    if 'ram' in keys:
+        ram_match = _RAM_RE.search(title_lower)
+        if ram_match:
+            attributes.append(('ram', f"{ram_match.group(1)}gb"))
+
+    # Extract color
+    if 'color' in keys:
+        color = _first_listed_term(_COLOR_RE, _COLOR_RANK, title_lower)
+        if color:
+            attributes.append(('color', color))
+
+    # Extract model numbers/names
+    if 'model' in keys:
+        model_match = _MODEL_RE.search(title_lower)
+        if model_match:
+            attributes.append(('model', model_match.group(1)))
+
+    return tuple(attributes)
+
+
+@lru_cache(maxsize=2048)
+def _title_tokens(title_lower: str) -> FrozenSet[str]:
+    """Split a lowercased title into a punctuation-free word set (memoized)"""
+    return frozenset(title_lower.translate(_TOKEN_TABLE).split())
+
+
+@dataclass
+class NormalizedResult:
+    """
+    Normalized shopping result
+
+    Slotted to keep per-record memory low and field access fast while results are
+    filtered and ranked; converted to a plain dict (via to_dict) at the API boundary.
+    """
+    __slots__ = ('title', 'title_lower', 'tokens', 'price', 'currency', 'url', 'seller', 'platform',
+                 'rating', 'reviews', 'delivery', 'in_stock', 'thumbnail')
+
+    title: str
+    title_lower: str  # Reused by similarity checks; not part of the API payload
+    tokens: FrozenSet[str]  # Title word set for Jaccard similarity; not part of the API payload
+    price: float
+    currency: str
+    url: str
+    seller: str
+    platform: str  # Pre-computed platform name
+    rating: float
+    reviews: int
+    delivery: str
+    in_stock: bool
+    thumbnail: str
+
+    def to_dict(self) -> Dict:
+        """Return the API/cache representation of this result"""
+        return {
+            "title": self.title,
+            "price": self.price,
+            "currency": self.currency,
+            "url": self.url,
+            "seller": self.seller,
+            "platform": self.platform,
+            "rating": self.rating,
+            "reviews": self.reviews,
+            "delivery": self.delivery,
+            "in_stock": self.in_stock,
+            "thumbnail": self.thumbnail
+        }
 
 
 class SerperPriceComparison:
@@ -28,6 +191,13 @@ class SerperPriceComparison:
         elif provider == 'duckduckgo':
             print("✓ Using DuckDuckGo for price comparison (free)")
 
+        # Keep-alive session so repeat comparisons skip the TCP/TLS handshake
+        self._session = create_http_session(pool_size=10)
+
+        # (product_name, location, num_results) -> raw search response; callers must not mutate it
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        self._search_cache_lock = threading.Lock()
+
     def search_shopping(
         self,
         product_name: str,
@@ -43,25 +213,40 @@ class SerperPriceComparison:
             num_results: Number of results to fetch (default: 20)
 
         Returns:
-            Dictionary with shopping results
+            Dictionary with shopping results (shared via cache; treat as read-only)
         """
+        cache_key = (product_name, location, num_results)
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            print(f"✓ Using cached shopping results for '{product_name}'")
+            return cached
+
         raw_response = search_shopping_api(
             product_name=product_name,
             location=location,
-            num_results=num_results
+            num_results=num_results,
+            session=self._session
         )
 
         # DEBUG: Print raw API response
         provider = os.getenv('SEARCH_PROVIDER', 'duckduckgo').lower()
-        print("\n" + "="*80)
-        print(f"🔍 DEBUG: RAW SEARCH API RESPONSE ({provider.upper()})")
-        print("="*80)
-        print(f"Response type: {type(raw_response)}")
-        print(f"Response keys: {list(raw_response.keys()) if isinstance(raw_response, dict) else 'N/A'}")
-        print("\nFull response:")
-        import json
-        print(json.dumps(raw_response, indent=2, ensure_ascii=False))
-        print("="*80 + "\n")
+        print(f"🔍 Search API response ({provider}): type={type(raw_response).__name__}, "
+              f"keys={list(raw_response.keys()) if isinstance(raw_response, dict) else 'N/A'}")
+
+        # Full dump is opt-in: serializing the whole payload on every comparison is costly
+        if os.getenv('DEBUG_SEARCH', 'false').lower() in ('1', 'true', 'yes'):
+            import orjson
+            print("="*80)
+            print(f"🔍 DEBUG: RAW SEARCH API RESPONSE ({provider.upper()})")
+            print("="*80)
+            print(orjson.dumps(raw_response, option=orjson.OPT_INDENT_2).decode())
+            print("="*80 + "\n")
+
+        # Don't cache failures so the next request retries the provider
+        if isinstance(raw_response, dict) and "error" not in raw_response:
+            with self._search_cache_lock:
+                self._search_cache[cache_key] = raw_response
 
         return raw_response
 
@@ -76,25 +261,10 @@ class SerperPriceComparison:
             Platform name (e.g., "amazon", "flipkart", or actual seller name for unknown platforms)
         """
         source_lower = source.lower()
-
-        if "amazon" in source_lower:
-            return "amazon"
-        elif "flipkart" in source_lower:
-            return "flipkart"
-        elif "ebay" in source_lower:
-            return "ebay"
-        elif "walmart" in source_lower:
-            return "walmart"
-        elif "myntra" in source_lower:
-            return "myntra"
-        elif "snapdeal" in source_lower:
-            return "snapdeal"
-        elif "croma" in source_lower:
-            return "croma"
-        elif "tata" in source_lower:
-            return "tata"
-        else:
-            return source_lower  # Return actual seller name instead of "others"
+        match = _PLATFORM_RE.search(source_lower)
+        # Return actual seller name instead of "others" for unknown platforms.
+        # Interned so grouping keys compare by identity
+        return sys.intern(match.group(1) if match else source_lower)
 
     def _parse_currency(self, price_str: str) -> str:
         """
@@ -106,92 +276,72 @@ class SerperPriceComparison:
         Returns:
             Currency symbol or code
         """
-        if "₹" in price_str:
-            return "INR"
-        elif "$" in price_str:
-            return "USD"
-        elif "€" in price_str:
-            return "EUR"
-        elif "£" in price_str:
-            return "GBP"
-        else:
-            return "INR"  # Default
-
-    def _extract_product_attributes(self, title: str) -> Dict[str, str]:
+        # Currency symbols lead the string (e.g. "₹15,999", "US$199"), so scan the prefix once
+        for ch in price_str[:4]:
+            code = _CURRENCY_MAP.get(ch)
+            if code:
+                return code
+        return "INR"  # Default
+
+    def _extract_product_attributes(
+        self,
+        title: str,
+        title_lower: Optional[str] = None,
+        keys: FrozenSet[str] = _SIMILARITY_KEYS
+    ) -> Dict[str, str]:
         """
         Extract key product attributes from title
 
         Args:
             title: Product title
+            title_lower: Precomputed title.lower() (optional)
+            keys: Attributes to extract (default: brand, storage, ram, model;
+                pass _ALL_ATTRIBUTE_KEYS to include color)
 
         Returns:
             Dictionary of attributes (brand, model, storage, ram, color, etc.)
         """
-        title_lower = title.lower()
-        attributes = {}
-
-        # Extract brand (common brands)
-        brands = ['apple', 'samsung', 'oneplus', 'xiaomi', 'realme', 'oppo', 'vivo',
-                  'google', 'motorola', 'nokia', 'asus', 'sony', 'lg', 'huawei',
-                  'iphone', 'galaxy', 'pixel', 'redmi', 'poco']
-        for brand in brands:
-            if brand in title_lower:
-                attributes['brand'] = brand
-                break
-
-        # Extract storage capacity (GB, TB)
-        storage_match = re.search(r'(\d+)\s*(gb|tb)', title_lower)
-        if storage_match:
-            attributes['storage'] = f"{storage_match.group(1)}{storage_match.group(2)}"
-
-        # Extract RAM
-        ram_match = re.search(r'(\d+)\s*gb\s*ram', title_lower)
-        if ram_match:
-            attributes['ram'] = f"{ram_match.group(1)}gb"
-
-        # Extract color
-        colors = ['black', 'white', 'blue', 'red', 'green', 'yellow', 'pink', 'purple',
-                  'gold', 'silver', 'grey', 'gray', 'titanium', 'natural', 'midnight',
-                  'starlight', 'sierra', 'alpine']
-        for color in colors:
-            if color in title_lower:
-                attributes['color'] = color
-                break
-
-        # Extract model numbers/names
-        model_match = re.search(r'(pro max|pro|plus|ultra|lite|mini|\d+[a-z]?)', title_lower)
-        if model_match:
-            attributes['model'] = model_match.group(1)
-
-        return attributes
+        return dict(_title_attributes(title_lower if title_lower is not None else title.lower(), keys))
 
-    def _calculate_product_similarity(self, title1: str, title2: str) -> float:
+    def _calculate_product_similarity(
+        self,
+        title1: str,
+        title2: str,
+        title1_lower: Optional[str] = None,
+        title2_lower: Optional[str] = None,
+        tokens2: Optional[FrozenSet[str]] = None,
+        threshold: Optional[float] = None
+    ) -> float:
         """
         Calculate similarity between two product titles
 
         Args:
             title1: First product title
             title2: Second product title
+            title1_lower: Precomputed title1.lower() (optional)
+            title2_lower: Precomputed title2.lower() (optional)
+            tokens2: Precomputed title2 word set (optional)
+            threshold: Match threshold the caller compares against (optional); when even a
+                perfect text match could not reach it, the attribute-only score is returned
 
         Returns:
-            Similarity score (0.0 to 1.0)
+            Similarity score (0.0 to 1.0); exact whenever it can reach threshold
         """
-        # Normalize titles
-        t1 = re.sub(r'[^\w\s]', '', title1.lower())
-        t2 = re.sub(r'[^\w\s]', '', title2.lower())
-
-        # Use SequenceMatcher for basic similarity
-        sequence_similarity = SequenceMatcher(None, t1, t2).ratio()
+        # Lowercase each title once; attributes and tokenization share it
+        if title1_lower is None:
+            title1_lower = title1.lower()
+        if title2_lower is None:
+            title2_lower = title2.lower()
 
         # Extract and compare attributes
-        attrs1 = self._extract_product_attributes(title1)
-        attrs2 = self._extract_product_attributes(title2)
+        attrs1 = self._extract_product_attributes(title1, title1_lower)
+        attrs2 = self._extract_product_attributes(title2, title2_lower)
 
         # Weight attribute matches more heavily
         attribute_matches = 0
         total_attributes = 0
 
-        for key in ['brand', 'storage', 'ram', 'model']:
+        for key in _SIMILARITY_KEYS:
             if key in attrs1 or key in attrs2:
                 total_attributes += 1
                 if key in attrs1 and key in attrs2 and attrs1[key] == attrs2[key]:
@@ -199,12 +349,33 @@ class SerperPriceComparison:
 
         attribute_similarity = attribute_matches / total_attributes if total_attributes > 0 else 0
 
+        # Text similarity adds at most 0.4; if that still falls short of the threshold the
+        # result is a non-match either way, so skip the text comparison (most noisy results)
+        if threshold is not None and attribute_similarity * 0.6 + 0.4 < threshold:
+            return attribute_similarity * 0.6
+
+        # Word-set Jaccard: linear time and insensitive to word order
+        # ("Apple iPhone 15 Pro" vs "iPhone 15 Pro - Apple")
+        tokens1 = _title_tokens(title1_lower)
+        if tokens2 is None:
+            tokens2 = _title_tokens(title2_lower)
+        union = tokens1 | tokens2
+        text_similarity = len(tokens1 & tokens2) / len(union) if union else 0.0
+
         # Weighted average (attributes are more important than text similarity)
-        final_similarity = (attribute_similarity * 0.7) + (sequence_similarity * 0.3)
+        final_similarity = (attribute_similarity * 0.6) + (text_similarity * 0.4)
 
         return final_similarity
 
-    def _is_same_product(self, original_title: str, result_title: str, threshold: float = 0.65) -> bool:
+    def _is_same_product(
+        self,
+        original_title: str,
+        result_title: str,
+        threshold: float = 0.65,
+        original_title_lower: Optional[str] = None,
+        result_title_lower: Optional[str] = None,
+        result_tokens: Optional[FrozenSet[str]] = None
+    ) -> bool:
         """
         Check if result is the same product as original
 
@@ -212,11 +383,17 @@ class SerperPriceComparison:
             original_title: Original product title
             result_title: Result product title
             threshold: Similarity threshold (default: 0.65)
+            original_title_lower: Precomputed original_title.lower() (optional)
+            result_title_lower: Precomputed result_title.lower() (optional)
+            result_tokens: Precomputed result_title word set (optional)
 
         Returns:
             True if same product, False otherwise
         """
-        similarity = self._calculate_product_similarity(original_title, result_title)
+        similarity = self._calculate_product_similarity(
+            original_title, result_title, original_title_lower, result_title_lower,
+            result_tokens, threshold
+        )
         return similarity >= threshold
 
     def _extract_direct_url(self, url: str) -> str:
@@ -234,23 +411,23 @@ class SerperPriceComparison:
 
         # Check if it's a Google redirect URL
         if "google.com/url" in url or "google.com/shopping" in url:
-            # Try to extract the actual URL from 'q' parameter
-            import urllib.parse
-            parsed = urllib.parse.urlparse(url)
-            params = urllib.parse.parse_qs(parsed.query)
-
-            # Google uses 'q' parameter for the redirect URL
-            if 'q' in params:
-                return params['q'][0]
-
-            # Some Shopping URLs use 'url' parameter
-            if 'url' in params:
-                return params['url'][0]
+            # One regex scan for the redirect parameters instead of decoding the whole query
+            url_param = None
+            for match in _GOOGLE_Q_RE.finditer(url.partition('#')[0]):
+                # Google uses 'q' parameter for the redirect URL
+                if match.group(1) == 'q':
+                    return urllib.parse.unquote_plus(match.group(2))
+                # Some Shopping URLs use 'url' parameter
+                if url_param is None:
+                    url_param = match.group(2)
+
+            if url_param is not None:
+                return urllib.parse.unquote_plus(url_param)
 
         # Return original URL if not a redirect
         return url
 
-    def _normalize_result(self, result: Dict) -> Dict:
+    def _normalize_result(self, result: Dict) -> Optional[NormalizedResult]:
         """
         Normalize a single shopping result
 
@@ -258,7 +435,7 @@ class SerperPriceComparison:
             result: Raw result from Serper API
 
         Returns:
-            Normalized result dictionary
+            NormalizedResult, or None if the result could not be parsed
         """
         try:
             price_str = result.get("price", "0")
@@ -267,7 +444,7 @@ class SerperPriceComparison:
             # If extracted_price is not available, try to parse from price string
             if not extracted_price and price_str:
                 # Remove currency symbols and commas
-                price_clean = re.sub(r'[^\d.]', '', price_str)
+                price_clean = _PRICE_CLEAN_RE.sub('', price_str)
                 try:
                     extracted_price = float(price_clean)
                 except ValueError:
@@ -281,26 +458,31 @@ class SerperPriceComparison:
             seller = result.get("source", "N/A")
             platform = self._extract_platform_from_source(seller)
 
-            return {
-                "title": result.get("title", "N/A"),
-                "price": float(extracted_price) if extracted_price else 0.0,
-                "currency": self._parse_currency(price_str),
-                "url": direct_url,
-                "seller": seller,
-                "platform": platform,  # Pre-computed platform name
-                "rating": result.get("rating", 0.0),
+            title = result.get("title", "N/A")
+            title_lower = title.lower()
+
+            return NormalizedResult(
+                title=title,
+                title_lower=title_lower,
+                tokens=_title_tokens(title_lower),
+                price=float(extracted_price) if extracted_price else 0.0,
+                currency=self._parse_currency(price_str),
+                url=direct_url,
+                seller=seller,
+                platform=platform,
+                rating=result.get("rating", 0.0),
                 # API returns "ratingCount" (not "reviews")
-                "reviews": result.get("ratingCount", result.get("reviews", 0)),
-                "delivery": result.get("delivery", "N/A"),
-                "in_stock": True,  # Assume in stock if listed
+                reviews=result.get("ratingCount", result.get("reviews", 0)),
+                delivery=result.get("delivery", "N/A"),
+                in_stock=True,  # Assume in stock if listed
                 # API returns "imageUrl" (not "thumbnail")
-                "thumbnail": result.get("imageUrl", result.get("thumbnail", ""))
-            }
+                thumbnail=result.get("imageUrl", result.get("thumbnail", ""))
+            )
         except Exception as e:
             print(f"⚠ Error normalizing result: {str(e)}")
             return None
 
-    def group_by_platform(self, results: List[Dict]) -> Dict:
+    def group_by_platform(self, results: List[NormalizedResult]) -> Dict:
         """
         Group results by platform
 
@@ -308,7 +490,7 @@ class SerperPriceComparison:
             results: List of normalized results (with pre-computed platform field)
 
         Returns:
-            Dictionary with results grouped by platform
+            Dictionary with results (as dicts) grouped by platform
         """
         grouped = {}
 
@@ -316,24 +498,33 @@ class SerperPriceComparison:
             if not result:
                 continue
 
-            platform = result["platform"]  # Use pre-computed platform
+            platform = result.platform  # Use pre-computed platform
             if platform not in grouped:
                 grouped[platform] = []
-            grouped[platform].append(result)
+            grouped[platform].append(result.to_dict())
 
         return grouped
 
-    def calculate_price_stats(self, results: List[Dict]) -> Dict:
+    def calculate_price_stats(
+        self,
+        prices: List[float],
+        min_price: float,
+        max_price: float,
+        price_sum: float
+    ) -> Dict:
         """
-        Calculate price statistics
+        Calculate price statistics from values accumulated while filtering
 
         Args:
-            results: List of normalized results with valid prices (already filtered)
+            prices: Valid (positive) prices of the matched results
+            min_price: Smallest price in prices
+            max_price: Largest price in prices
+            price_sum: Sum of prices
 
         Returns:
             Dictionary with price statistics
         """
-        if not results:
+        if not prices:
             return {
                 "min_price": 0.0,
                 "max_price": 0.0,
@@ -342,17 +533,15 @@ class SerperPriceComparison:
                 "total_results": 0
             }
 
-        prices = [r["price"] for r in results]
-
         return {
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "avg_price": statistics.mean(prices),
-            "median_price": statistics.median(prices),
+            "min_price": min_price,
+            "max_price": max_price,
+            "avg_price": price_sum / len(prices),
+            "median_price": float(np.median(prices)),  # only stat that needs the full set
             "total_results": len(prices)
         }
 
-    def find_best_deal(self, results: List[Dict]) -> Optional[Dict]:
+    def find_best_deal(self, results: List[NormalizedResult]) -> Optional[Dict]:
         """
         Find the best deal (lowest price with good rating)
 
@@ -365,26 +554,21 @@ class SerperPriceComparison:
         if not results:
             return None
 
-        # Sort by price (ascending), then by rating (descending)
-        sorted_results = sorted(
-            results,
-            key=lambda x: (x["price"], -x["rating"])
-        )
-
-        best = sorted_results[0]  # Lowest price
-        max_price = sorted_results[-1]["price"]  # Highest price
+        # Lowest price, ties broken by higher rating (two O(N) scans instead of a sort)
+        best = min(results, key=lambda x: (x.price, -x.rating))
+        max_price = max(r.price for r in results)  # Highest price
 
-        savings = max_price - best["price"]
+        savings = max_price - best.price
         savings_percent = (savings / max_price * 100) if max_price > 0 else 0
 
         return {
-            "platform": best["platform"],  # Use pre-computed platform
-            "title": best["title"],
-            "price": best["price"],
-            "currency": best["currency"],
-            "url": best["url"],
-            "seller": best["seller"],
-            "rating": best["rating"],
+            "platform": best.platform,  # Use pre-computed platform
+            "title": best.title,
+            "price": best.price,
+            "currency": best.currency,
+            "url": best.url,
+            "seller": best.seller,
+            "rating": best.rating,
             "savings": round(savings, 2),
             "savings_percent": round(savings_percent, 2)
         }
@@ -443,39 +627,60 @@ class SerperPriceComparison:
         filtered_out_count = 0
         source_platform_filtered_count = 0
 
-        for result in shopping_results:
-            normalized = self._normalize_result(result)
-            if normalized:
-                # Filter out source platform (use pre-computed platform)
-                if normalized['platform'] == source_platform:
-                    source_platform_filtered_count += 1
-                    continue
+        product_name_lower = product_name.lower()
 
+        normalized_all = [self._normalize_result(result) for result in shopping_results]
 
-                if self._is_same_product(product_name, normalized['title'], 0.65):
-                    normalized_results.append(normalized)
-                else:
-                    filtered_out_count += 1
+        # Single pass: filter matches, group ALL of them by platform (including those
+        # without prices), and accumulate price stats for the priced ones
+        grouped = defaultdict(list)
+        valid_price_results = []
+        no_price_count = 0
+        min_price, max_price, price_sum = float('inf'), 0.0, 0.0
 
+        for normalized in normalized_all:
+            if not normalized:
+                continue
 
-        # Print filtering summary
-        print(f"✓ Found {len(normalized_results)} valid results (filtered: {source_platform_filtered_count} from source platform, {filtered_out_count} non-exact matches)")
+            # Filter out source platform (use pre-computed platform)
+            if normalized.platform == source_platform:
+                source_platform_filtered_count += 1
+                continue
+
+            if not self._is_same_product(
+                product_name, normalized.title, 0.65,
+                product_name_lower, normalized.title_lower, normalized.tokens
+            ):
+                filtered_out_count += 1
+                continue
+
+            normalized_results.append(normalized)
+            grouped[normalized.platform].append(normalized.to_dict())  # Use pre-computed platform
+
+            price = normalized.price
+            if price > 0:
+                valid_price_results.append(normalized)
+                min_price = min(min_price, price)
+                max_price = max(max_price, price)
+                price_sum += price
+            else:
+                no_price_count += 1
 
-        # Separate results with and without prices
-        valid_price_results = [r for r in normalized_results if r and r["price"] > 0]
-        no_price_results = [r for r in normalized_results if r and r["price"] == 0]
+        grouped = dict(grouped)
 
-        # Group ALL results by platform (including those without prices)
-        grouped = self.group_by_platform(normalized_results)
+        # Print filtering summary
+        print(f"✓ Found {len(normalized_results)} valid results (filtered: {source_platform_filtered_count} from source platform, {filtered_out_count} non-exact matches)")
 
-        # Calculate statistics only for results with prices
-        stats = self.calculate_price_stats(valid_price_results)
+        # Statistics only for results with prices
+        stats = self.calculate_price_stats(
+            [r.price for r in valid_price_results], min_price, max_price, price_sum
+        )
 
         # Find best deal only from results with prices
         best_deal = self.find_best_deal(valid_price_results) if valid_price_results else None
 
         # Print summary
-        currency = normalized_results[0]['currency'] if normalized_results else 'INR'
+        currency = normalized_results[0].currency if normalized_results else 'INR'
         print(f"\n📊 Price Summary:")
         print(f"  Platforms found: {len(grouped)}")
         if valid_price_results:
@@ -484,7 +689,7 @@ class SerperPriceComparison:
                 print(f"  Best deal: {best_deal['platform']} at {best_deal['currency']} {best_deal['price']:.2f}")
                 print(f"  Potential savings: {best_deal['currency']} {best_deal['savings']:.2f} ({best_deal['savings_percent']:.1f}%)")
         else:
-            print(f"  ⚠ No prices available, but showing {len(no_price_results)} competitor links")
+            print(f"  ⚠ No prices available, but showing {no_price_count} competitor links")
 
         return {
             "price_comparison": grouped,
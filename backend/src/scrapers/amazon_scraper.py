@@ -3,15 +3,147 @@ Amazon Product Scraper
 Implements BaseScraper interface for Amazon e-commerce platform
 """
 
+import logging
 import re
 import time
 import random
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
 from .base_scraper import BaseScraper
 from src.llm_extractor import LLMProductExtractor
 
+logger = logging.getLogger(__name__)
+
+
+# Feature bullets kept per product
+MAX_FEATURES = 10
+
+# Pooled keep-alive connections per client (amortizes the TLS handshake)
+SESSION_POOL_SIZE = 32
+
+# Patterns compiled once at import instead of per extractor call
+# Product path segment; group 1 is the ASIN (host-agnostic, e.g. amazon.com.au works too)
+_ASIN_RE = re.compile(r'/(?:dp|gp/product|ASIN|product)/([A-Z0-9]{10})')
+# Supported Amazon hosts (plus country suffixes such as .com.au), matched in the authority only
+_AMAZON_HOST_RE = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)*amazon\.(?:com|in|co\.uk|de|fr)(?:\.[a-z]{2})?(?:[:/?#]|$)',
+    re.IGNORECASE
+)
+_NUM_RE = re.compile(r'([\d,]+)')
+_PCT_RE = re.compile(r'(\d+)%')
+_COLOR_IMAGES_RE = re.compile(r'"colorImages":\s*\{[^}]*"initial":\s*\[([^\]]+)\]')
+_LARGE_URL_RE = re.compile(r'"(?:large|hiRes)":\s*"([^"]+)"')
+_HIRES_RE = re.compile(r'"hiRes":\s*"([^"]+)"')
+# Thumbnail size token, e.g. _AC_SX300_ / _SY445_ / _AC38_
+_IMG_SIZE_RE = re.compile(r'_AC_[A-Z]{2}\d+_|_[AS][XYC]\d+_')
+# Bytes pattern: the captcha check runs on the raw body, skipping the unicode decode
+_CAPTCHA_RE = re.compile(
+    rb'captcha|robot check|enter the characters you see|type the characters'
+    rb'|sorry, we just need to make sure|automated access',
+    re.IGNORECASE
+)
+_WARRANTY_RE = re.compile(r'warranty|guarantee|guaranty', re.IGNORECASE)
+_REVIEW_DATE_RE = re.compile(r'on (.+)$')
+
+# Every specification/details section, found in one scan (see _index_spec_sections)
+_SPEC_SECTIONS_XPATH = etree.XPath(
+    '//div[contains(@id, "productDetails") or @id="tech-spec-desktop" or @id="detailBullets_feature_div"]'
+    ' | //table[contains(@id, "productDetails_techSpec_section")]'
+)
+
+# Top-level ids the BeautifulSoup tree still needs (image carousel fallbacks)
+_SOUP_KEEP_IDS = frozenset(('landingImage', 'imageBlock'))
+
+
+def _keep_for_soup(name: str, attrs: Dict) -> bool:
+    """
+    SoupStrainer filter: keep only the subtrees _extract_images reads
+
+    Called with raw tag data while parsing; a matching tag keeps all its descendants.
+
+    Args:
+        name: Tag name
+        attrs: Raw tag attributes
+
+    Returns:
+        True if the tag (and its subtree) should be materialized
+    """
+    if attrs.get('id') in _SOUP_KEEP_IDS:
+        return True
+
+    classes = attrs.get('class') or ''
+    if isinstance(classes, str):
+        classes = classes.split()
+    return 'imgTagWrapper' in classes
+
+
+_SOUP_STRAINER = SoupStrainer(_keep_for_soup)
+
+
+
+def _class_pred(class_name: str) -> str:
+    """
+    XPath predicate matching an element's class the way BeautifulSoup's class_ does
+
+    A single class matches any element carrying it; a space-separated value must
+    equal the whole class attribute.
+
+    Args:
+        class_name: Class name (or exact multi-class string)
+
+    Returns:
+        XPath predicate (without brackets)
+    """
+    if ' ' in class_name:
+        return f'@class="{class_name}"'
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+@lru_cache(maxsize=None)
+def _compile_first(xpath: str) -> etree.XPath:
+    """Compile (once per selector) an XPath that stops at the first match in document order"""
+    return etree.XPath(f'({xpath})[1]')
+
+
+def _first(node: lxml_html.HtmlElement, xpath: str) -> Optional[lxml_html.HtmlElement]:
+    """Return the first element matching xpath under node, or None"""
+    found = _compile_first(xpath)(node)
+    return found[0] if found else None
+
+
+# Multi-match queries run on every page, compiled once
+_CELLS_XPATH = etree.XPath('.//th|.//td')
+# Review containers (data-hook, else legacy customer_review-* ids) and, per review, every
+# field element: any data-hook, plus the author and star-rating fallback classes
+_REVIEW_DIVS_XPATH = etree.XPath('//div[@data-hook="review"]')
+_REVIEW_ID_DIVS_XPATH = etree.XPath('//div[contains(@id, "customer_review-")]')
+_REVIEW_PART_CLASSES = frozenset(('a-profile-name', 'a-icon-alt'))
+_REVIEW_PARTS_XPATH = etree.XPath(
+    f'.//*[@data-hook or {" or ".join(_class_pred(c) for c in sorted(_REVIEW_PART_CLASSES))}]'
+)
+_FEATURE_ITEMS_XPATH = etree.XPath(f'//div[@id="feature-bullets"]//span[{_class_pred("a-list-item")}]')
+# The carousel data script, read straight from the lxml tree ('' if absent): the first
+# colorImages script, else the first ImageBlockATF one
+_COLOR_IMAGES_SCRIPT_XPATH = etree.XPath(
+    'string((//script[@type="text/javascript"][contains(., "colorImages")])[1])', smart_strings=False
+)
+_IMAGE_BLOCK_SCRIPT_XPATH = etree.XPath(
+    'string((//script[@type="text/javascript"][contains(., "ImageBlockATF")])[1])', smart_strings=False
+)
+
+
+@lru_cache(maxsize=1024)
+def _asin_from_url(url: str) -> Optional[str]:
+    """ASIN from a product URL, or None (memoized: validate and extract share the work)"""
+    match = _ASIN_RE.search(url)
+    return match.group(1) if match else None
+
 
 class AmazonScraper(BaseScraper):
     """Scrapes product information and reviews from Amazon"""
@@ -25,15 +157,50 @@ class AmazonScraper(BaseScraper):
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
     ]
 
+    # Realistic browser headers, built once; each instance adds its own User-Agent
+    _HEADER_TEMPLATE = MappingProxyType({
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+        'sec-ch-ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"',
+    })
+
     def __init__(self):
         """Initialize Amazon scraper with anti-bot evasion"""
         self.session = requests.Session()
+        self.session.verify = True
+
+        # Reuse connections across the batch and retry transient failures with backoff.
+        # 429/503 are not retried: Amazon answers bot blocks with them, so they go
+        # straight to the captcha/blocked handling instead of sending more requests
+        adapter = HTTPAdapter(
+            pool_connections=SESSION_POOL_SIZE,
+            pool_maxsize=SESSION_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 504],
+                allowed_methods=['GET']
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         # Select a random user agent for this session
         self.user_agent = random.choice(self.USER_AGENTS)
 
         # Build realistic headers
-        self.headers = self._build_headers()
+        self.headers = {'User-Agent': self.user_agent, **self._HEADER_TEMPLATE}
         self.session.headers.update(self.headers)
 
         # Initialize LLM extractor
@@ -42,26 +209,6 @@ class AmazonScraper(BaseScraper):
         # Request count for realistic delays
         self.request_count = 0
 
-    def _build_headers(self) -> Dict[str, str]:
-        """Build realistic browser headers"""
-        return {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'sec-ch-ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-        }
-
     def _realistic_delay(self):
         """Add realistic human-like delays between requests"""
         self.request_count += 1
@@ -75,27 +222,11 @@ class AmazonScraper(BaseScraper):
 
         time.sleep(delay)
 
-    def _detect_captcha(self, response: requests.Response) -> bool:
-        """Detect if Amazon is showing a CAPTCHA page"""
-        content = response.text.lower()
-
-        # Check for common CAPTCHA indicators
-        captcha_indicators = [
-            'captcha',
-            'robot check',
-            'enter the characters you see',
-            'type the characters',
-            'sorry, we just need to make sure',
-            'automated access',
-        ]
-
-        # Very short responses are suspicious
-        if len(response.text) < 10000:
-            for indicator in captcha_indicators:
-                if indicator in content:
-                    return True
+    def _detect_captcha(self, body: bytes) -> bool:
+        """Detect if Amazon is showing a CAPTCHA page (body: raw response bytes)"""
 
-        return False
+        # Very short responses are suspicious; check them for common CAPTCHA indicators
+        return len(body) < 10000 and _CAPTCHA_RE.search(body) is not None
 
     def get_platform_name(self) -> str:
         """Returns platform name"""
@@ -106,26 +237,11 @@ class AmazonScraper(BaseScraper):
         if not url or not isinstance(url, str):
             return False
 
-        amazon_domains = ['amazon.com', 'amazon.in', 'amazon.co.uk', 'amazon.de', 'amazon.fr']
-        is_amazon = any(domain in url.lower() for domain in amazon_domains)
-        has_asin = self.extract_product_id(url) is not None
-
-        return is_amazon and has_asin
+        return _AMAZON_HOST_RE.match(url) is not None and _asin_from_url(url) is not None
 
     def extract_product_id(self, url: str) -> Optional[str]:
         """Extract ASIN from Amazon product URL"""
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'/ASIN/([A-Z0-9]{10})',
-            r'/product/([A-Z0-9]{10})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return _asin_from_url(url) if url else None
 
     def scrape_product(self, url: str) -> Dict:
         """
@@ -152,70 +268,101 @@ class AmazonScraper(BaseScraper):
 
             # Fetch product page with realistic browser behavior
             response = self.session.get(url, timeout=20)
+
+            # Bot-block pages often come back as 503, so check before the status
+            self._check_captcha(response.content, asin)
             response.raise_for_status()
 
-            # Check for CAPTCHA/bot detection
-            if self._detect_captcha(response):
-                raise ValueError(
-                    "Amazon has detected automated access for this product. "
-                    "This usually happens with high-demand items like smartphones. "
-                    "The product may require manual access on Amazon.in. "
-                    f"Product ASIN: {asin}"
-                )
-
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Extract product data
-            product_data = {
-                'platform': self.get_platform_name(),
-                'product_id': asin,  # Generic product ID
-                'asin': asin,  # Amazon-specific ASIN (for backward compatibility)
-                'url': url,
-                'title': self._extract_title(soup),
-                'brand': self._extract_brand(soup),
-                'price': self._extract_price(soup),
-                'rating': self._extract_rating(soup),
-                'total_reviews': self._extract_total_reviews(soup),
-                'description': self._extract_description(soup),
-                'features': self._extract_features(soup),
-                'seller_name': self._extract_seller_name(soup),
-                'seller_rating': self._extract_seller_rating(soup),
-                'specifications': self._extract_specifications(soup),
-                'product_details': self._extract_product_details(soup),
-                'technical_details': self._extract_technical_details(soup),
-                'additional_information': self._extract_additional_information(soup),
-                'warranty': self._extract_warranty(soup),
-                'availability': self._extract_availability(soup),
-                'images': self._extract_images(soup),
-                'category': self._extract_category(soup),
-                'reviews': []
-            }
-
-            # Scrape reviews from product page
-            print(f"\n📄 Scraping reviews for ASIN: {asin}")
-            reviews = self._scrape_reviews_from_product_page(soup)
-            print(f"✓ Scraped {len(reviews)} reviews from product page\n")
-            product_data['reviews'] = reviews
-
-            # Use LLM extraction to enhance and fill missing data
-            try:
-                print("🤖 Enhancing data with LLM extraction...")
-                # Pass BeautifulSoup object directly instead of raw HTML to avoid double parsing
-                llm_data = self.llm_extractor.extract_product_data(soup, url)
-
-                # Merge LLM data with traditional scraping
-                product_data = self._merge_product_data(product_data, llm_data)
-                print("✓ LLM enhancement complete")
-            except Exception as e:
-                print(f"⚠ LLM enhancement failed: {str(e)}")
-
-            return product_data
+            return self._parse_product_page(url, asin, response.content)
 
         except requests.exceptions.RequestException as e:
             raise requests.exceptions.RequestException(
                 f"Failed to scrape product. The page might be unavailable or blocked. Error: {str(e)}"
             )
 
+    def _check_captcha(self, content: bytes, asin: str) -> None:
+        """
+        Raise if the fetched page is a CAPTCHA/bot-detection page
+
+        Raises:
+            ValueError: If CAPTCHA detected
+        """
+        if self._detect_captcha(content):
+            raise ValueError(
+                "Amazon has detected automated access for this product. "
+                "This usually happens with high-demand items like smartphones. "
+                "The product may require manual access on Amazon.in. "
+                f"Product ASIN: {asin}"
+            )
+
+    def _parse_product_page(self, url: str, asin: str, content: bytes) -> Dict:
+        """
+        Extract product data (plus reviews and LLM enhancement) from a fetched page
+
+        Args:
+            url: Amazon product URL
+            asin: Product ASIN
+            content: Raw page bytes
+
+        Returns:
+            Dictionary containing product data
+        """
+        # Field extractors query lxml's C tree directly via XPath;
+        # BeautifulSoup only materializes the image carousel fallback subtrees
+        doc = lxml_html.fromstring(content)
+        soup = BeautifulSoup(content, 'lxml', parse_only=_SOUP_STRAINER)
+
+        # Lookups shared by several extractors, done once per page
+        features = self._extract_features(doc)
+        spec_sections, detail_sections = self._index_spec_sections(doc)
+        image_script = _COLOR_IMAGES_SCRIPT_XPATH(doc) or _IMAGE_BLOCK_SCRIPT_XPATH(doc)
+
+        # Extract product data
+        product_data = {
+            'platform': self.get_platform_name(),
+            'product_id': asin,  # Generic product ID
+            'asin': asin,  # Amazon-specific ASIN (for backward compatibility)
+            'url': url,
+            'title': self._extract_title(doc),
+            'brand': self._extract_brand(doc),
+            'price': self._extract_price(doc),
+            'rating': self._extract_rating(doc),
+            'total_reviews': self._extract_total_reviews(doc),
+            'description': self._extract_description(doc),
+            'features': features,
+            'seller_name': self._extract_seller_name(doc),
+            'seller_rating': self._extract_seller_rating(doc),
+            'specifications': self._extract_specifications(spec_sections),
+            'product_details': self._extract_product_details(detail_sections),
+            'technical_details': self._extract_technical_details(spec_sections),
+            'additional_information': self._extract_additional_information(spec_sections),
+            'warranty': self._extract_warranty(features, detail_sections),
+            'availability': self._extract_availability(doc),
+            'images': self._extract_images(soup, image_script),
+            'category': self._extract_category(doc),
+            'reviews': []
+        }
+
+        # Scrape reviews from product page
+        logger.info("Scraping reviews for ASIN: %s", asin)
+        reviews = self._scrape_reviews_from_product_page(doc)
+        logger.info("Scraped %d reviews from product page", len(reviews))
+        product_data['reviews'] = reviews
+
+        # Use LLM extraction to enhance and fill missing data
+        try:
+            logger.info("Enhancing data with LLM extraction")
+            # Share the already-parsed lxml tree instead of parsing the page again
+            llm_data = self.llm_extractor.extract_product_data(doc, url)
+
+            # Merge LLM data with traditional scraping
+            product_data = self._merge_product_data(product_data, llm_data)
+            logger.info("LLM enhancement complete")
+        except Exception as e:
+            logger.warning("LLM enhancement failed: %s", e)
+
+        return product_data
+
     def _merge_product_data(self, traditional_data: Dict, llm_data: Dict) -> Dict:
         """Merge traditional scraping data with LLM-extracted data"""
         merged = traditional_data.copy()
@@ -263,396 +410,358 @@ class AmazonScraper(BaseScraper):
                 merged['product_details'] = {}
             merged['product_details']['Item Weight'] = llm_data['weight']
 
-        print(f"  ✓ Added {len(merged.get('bank_offers', []))} bank offers from LLM")
+        logger.debug("Added %d bank offers from LLM", len(merged.get('bank_offers', [])))
 
         return merged
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _text(self, element: lxml_html.HtmlElement) -> str:
+        """Cleaned text content of an lxml element (BeautifulSoup get_text equivalent)"""
+        return self.clean_text(element.text_content())
+
+    def _extract_title(self, doc: lxml_html.HtmlElement) -> str:
         """Extract product title"""
         selectors = [
-            ('id', 'productTitle'),
-            ('class', 'product-title-word-break'),
-            ('id', 'title')
+            '//*[@id="productTitle"]',
+            f'//*[{_class_pred("product-title-word-break")}]',
+            '//*[@id="title"]'
         ]
 
-        for selector_type, selector_value in selectors:
-            if selector_type == 'id':
-                element = soup.find(id=selector_value)
-            else:
-                element = soup.find(class_=selector_value)
-
-            if element:
-                return self.clean_text(element.get_text())
+        for selector in selectors:
+            element = _first(doc, selector)
+            if element is not None:
+                return self._text(element)
 
         return "Title not found"
 
-    def _extract_brand(self, soup: BeautifulSoup) -> str:
+    def _extract_brand(self, doc: lxml_html.HtmlElement) -> str:
         """Extract brand name"""
         brand_selectors = [
-            {'id': 'bylineInfo'},
-            {'class': 'po-brand'},
-            {'class': 'a-size-base po-break-word'}
+            '@id="bylineInfo"',
+            _class_pred('po-brand'),
+            _class_pred('a-size-base po-break-word')
         ]
 
         for selector in brand_selectors:
-            element = soup.find('a', selector) or soup.find('span', selector)
-            if element:
-                text = element.get_text().strip()
+            element = _first(doc, f'//a[{selector}]')
+            if element is None:
+                element = _first(doc, f'//span[{selector}]')
+            if element is not None:
+                text = element.text_content().strip()
                 text = text.replace('Brand:', '').replace('Visit the', '').replace('Store', '').strip()
                 if text:
                     return self.clean_text(text)
 
         return "Brand not found"
 
-    def _extract_price(self, soup: BeautifulSoup) -> str:
+    def _extract_price(self, doc: lxml_html.HtmlElement) -> str:
         """Extract product price"""
         price_selectors = [
-            ('class', 'a-price-whole'),
-            ('class', 'a-offscreen'),
-            ('id', 'priceblock_ourprice'),
-            ('id', 'priceblock_dealprice'),
-            ('class', 'a-price aok-align-center reinventPricePriceToPayMargin priceToPay')
+            f'//*[{_class_pred("a-price-whole")}]',
+            f'//*[{_class_pred("a-offscreen")}]',
+            '//*[@id="priceblock_ourprice"]',
+            '//*[@id="priceblock_dealprice"]',
+            f'//*[{_class_pred("a-price aok-align-center reinventPricePriceToPayMargin priceToPay")}]'
         ]
 
-        for selector_type, selector_value in price_selectors:
-            if selector_type == 'id':
-                element = soup.find(id=selector_value)
-            else:
-                element = soup.find(class_=selector_value)
-
-            if element:
-                price_text = element.get_text().strip()
+        for selector in price_selectors:
+            element = _first(doc, selector)
+            if element is not None:
+                price_text = element.text_content().strip()
                 return price_text
 
         return "Price not available"
 
-    def _extract_rating(self, soup: BeautifulSoup) -> str:
+    def _extract_rating(self, doc: lxml_html.HtmlElement) -> str:
         """Extract overall rating"""
         rating_selectors = [
-            ('class', 'a-icon-alt'),
-            ('id', 'acrPopover'),
-            ('class', 'a-size-base a-color-base')
+            f'//span[{_class_pred("a-icon-alt")}]',
+            '//span[@id="acrPopover"]',
+            f'//span[{_class_pred("a-size-base a-color-base")}]'
         ]
 
-        for selector_type, selector_value in rating_selectors:
-            if selector_type == 'id':
-                element = soup.find('span', id=selector_value)
-            else:
-                element = soup.find('span', class_=selector_value)
-
-            if element:
-                text = element.get_text().strip()
+        for selector in rating_selectors:
+            element = _first(doc, selector)
+            if element is not None:
+                text = element.text_content().strip()
                 parsed = self.parse_rating(text)
                 if parsed:
                     return parsed
 
         return "Rating not available"
 
-    def _extract_total_reviews(self, soup: BeautifulSoup) -> str:
+    def _extract_total_reviews(self, doc: lxml_html.HtmlElement) -> str:
         """Extract total number of reviews"""
         review_selectors = [
-            ('id', 'acrCustomerReviewText'),
-            ('class', 'a-size-base a-link-normal')
+            '//*[@id="acrCustomerReviewText"]',
+            f'//span[{_class_pred("a-size-base a-link-normal")}]'
         ]
 
-        for selector_type, selector_value in review_selectors:
-            if selector_type == 'id':
-                element = soup.find(id=selector_value)
-            else:
-                element = soup.find('span', class_=selector_value)
-
-            if element:
-                text = element.get_text().strip()
-                match = re.search(r'([\d,]+)', text)
+        for selector in review_selectors:
+            element = _first(doc, selector)
+            if element is not None:
+                text = element.text_content().strip()
+                match = _NUM_RE.search(text)
                 if match:
                     return match.group(1)
 
         return "0"
 
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, doc: lxml_html.HtmlElement) -> str:
         """Extract product description"""
         desc_selectors = [
-            {'id': 'productDescription'},
-            {'id': 'feature-bullets'},
-            {'class': 'a-unordered-list a-vertical a-spacing-mini'}
+            '@id="productDescription"',
+            '@id="feature-bullets"',
+            _class_pred('a-unordered-list a-vertical a-spacing-mini')
         ]
 
         for selector in desc_selectors:
-            element = soup.find('div', selector) or soup.find('ul', selector)
-            if element:
-                return self.clean_text(element.get_text())
+            element = _first(doc, f'//div[{selector}]')
+            if element is None:
+                element = _first(doc, f'//ul[{selector}]')
+            if element is not None:
+                return self._text(element)
 
         return "Description not available"
 
-    def _extract_features(self, soup: BeautifulSoup) -> List[str]:
-        """Extract product features/bullet points"""
-        features = []
-
-        feature_div = soup.find('div', {'id': 'feature-bullets'})
-        if feature_div:
-            feature_items = feature_div.find_all('span', {'class': 'a-list-item'})
-            for item in feature_items:
-                text = self.clean_text(item.get_text())
-                if text and len(text) > 5:
-                    features.append(text)
+    def _extract_features(self, doc: lxml_html.HtmlElement) -> List[str]:
+        """Extract product features/bullet points (first MAX_FEATURES)"""
+        features = self._collect_features(_FEATURE_ITEMS_XPATH(doc))
 
         if not features:
-            feature_list = soup.find('ul', {'class': 'a-unordered-list a-vertical a-spacing-mini'})
-            if feature_list:
-                items = feature_list.find_all('li')
-                for item in items:
-                    text = self.clean_text(item.get_text())
-                    if text and len(text) > 5:
-                        features.append(text)
+            feature_list = _first(doc, f'//ul[{_class_pred("a-unordered-list a-vertical a-spacing-mini")}]')
+            if feature_list is not None:
+                features = self._collect_features(feature_list.iterfind('.//li'))
 
-        return features[:10]
+        return features
 
-    def _extract_seller_name(self, soup: BeautifulSoup) -> str:
+    def _collect_features(self, items: Iterable[lxml_html.HtmlElement]) -> List[str]:
+        """Cleaned texts longer than 5 chars, stopping once MAX_FEATURES are found"""
+        features = []
+        for item in items:
+            text = self._text(item)
+            if len(text) > 5:
+                features.append(text)
+                if len(features) == MAX_FEATURES:
+                    break
+        return features
+
+    def _extract_seller_name(self, doc: lxml_html.HtmlElement) -> str:
         """Extract seller name"""
         seller_selectors = [
-            {'id': 'sellerProfileTriggerId'},
-            {'class': 'tabular-buybox-text'},
-            {'id': 'merchantInfoFeature'}
+            '@id="sellerProfileTriggerId"',
+            _class_pred('tabular-buybox-text'),
+            '@id="merchantInfoFeature"'
         ]
 
         for selector in seller_selectors:
-            element = soup.find('a', selector) or soup.find('span', selector)
-            if element:
-                return self.clean_text(element.get_text())
+            element = _first(doc, f'//a[{selector}]')
+            if element is None:
+                element = _first(doc, f'//span[{selector}]')
+            if element is not None:
+                return self._text(element)
 
         return "Seller not found"
 
-    def _extract_seller_rating(self, soup: BeautifulSoup) -> str:
+    def _extract_seller_rating(self, doc: lxml_html.HtmlElement) -> str:
         """Extract seller rating"""
-        merchant_div = soup.find('div', {'id': 'merchantInfoFeature'})
-        if merchant_div:
-            rating_span = merchant_div.find('span', {'class': 'a-icon-alt'})
-            if rating_span:
-                text = rating_span.get_text().strip()
-                match = re.search(r'(\d+)%', text)
+        merchant_div = _first(doc, '//div[@id="merchantInfoFeature"]')
+        if merchant_div is not None:
+            rating_span = _first(merchant_div, f'.//span[{_class_pred("a-icon-alt")}]')
+            if rating_span is not None:
+                text = rating_span.text_content().strip()
+                match = _PCT_RE.search(text)
                 if match:
                     return f"{match.group(1)}%"
 
         return "Rating not available"
 
-    def _extract_specifications(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract product specifications"""
-        specifications = {}
+    def _index_spec_sections(
+        self, doc: lxml_html.HtmlElement
+    ) -> Tuple[Dict[str, lxml_html.HtmlElement], List[lxml_html.HtmlElement]]:
+        """
+        Find every specification/details section with a single tree scan
 
-        try:
-            product_info_section = soup.find('div', {'id': 'productDetails_techSpec_section_1'})
-            if product_info_section:
-                rows = product_info_section.find_all('tr')
-                for row in rows:
-                    header = row.find('th')
-                    value = row.find('td')
-                    if header and value:
-                        key = self.clean_text(header.get_text())
-                        val = self.clean_text(value.get_text())
-                        if key and val:
-                            specifications[key] = val
-
-            tech_details = soup.find('table', {'id': 'productDetails_techSpec_section_1'})
-            if tech_details:
-                rows = tech_details.find_all('tr')
-                for row in rows:
-                    header = row.find('th')
-                    value = row.find('td')
-                    if header and value:
-                        key = self.clean_text(header.get_text())
-                        val = self.clean_text(value.get_text())
-                        if key and val:
-                            specifications[key] = val
+        Args:
+            doc: Parsed product page
 
-        except Exception as e:
-            print(f"Error extracting specifications: {str(e)}")
+        Returns:
+            Tuple of ("tag#id" -> first matching element, productDetails* divs in page order)
+        """
+        index = {}
+        detail_sections = []
 
-        return specifications
+        for section in _SPEC_SECTIONS_XPATH(doc):
+            key = f"{section.tag}#{section.get('id')}"
+            index.setdefault(key, section)
+            if section.tag == 'div' and 'productDetails' in section.get('id', ''):
+                detail_sections.append(section)
 
-    def _extract_product_details(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract product details"""
-        details = {}
+        return index, detail_sections
 
-        try:
-            detail_sections = soup.find_all('div', {'id': re.compile(r'productDetails.*')})
+    def _iter_kv_rows(self, section: Optional[lxml_html.HtmlElement], layout: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield cleaned (key, value) pairs from one specification section
 
-            for section in detail_sections:
-                list_items = section.find_all('li')
-                for item in list_items:
-                    text = item.get_text()
-                    if ':' in text:
-                        parts = text.split(':', 1)
-                        if len(parts) == 2:
-                            key = self.clean_text(parts[0])
-                            value = self.clean_text(parts[1])
-                            if key and value:
-                                details[key] = value
-
-                rows = section.find_all('tr')
-                for row in rows:
-                    cols = row.find_all(['th', 'td'])
+        Args:
+            section: Section element (None yields nothing)
+            layout: Row layout - 'th_td' (first th/td in each tr), 'cols' (tr with exactly
+                two th/td cells), 'details' ("Key: Value" li text and 'cols' tr rows in one
+                document-order walk) or 'spans' (li with key/value spans)
+        """
+        if section is None:
+            return
+
+        if layout == 'th_td':
+            for row in section.iterfind('.//tr'):
+                header = row.find('.//th')
+                value = row.find('.//td')
+                if header is not None and value is not None:
+                    yield self._text(header), self._text(value)
+        elif layout == 'cols':
+            for row in section.iterfind('.//tr'):
+                cols = _CELLS_XPATH(row)
+                if len(cols) == 2:
+                    yield self._text(cols[0]), self._text(cols[1])
+        elif layout == 'details':
+            for node in section.iter('li', 'tr'):
+                if node.tag == 'tr':
+                    cols = _CELLS_XPATH(node)
                     if len(cols) == 2:
-                        key = self.clean_text(cols[0].get_text())
-                        value = self.clean_text(cols[1].get_text())
-                        if key and value:
-                            details[key] = value
-
+                        yield self._text(cols[0]), self._text(cols[1])
+                else:
+                    key, sep, value = node.text_content().partition(':')
+                    if sep:
+                        yield self.clean_text(key), self.clean_text(value)
+        elif layout == 'spans':
+            for item in section.iterfind('.//li'):
+                spans = item.findall('.//span')
+                if len(spans) >= 2:
+                    yield self.clean_text(spans[0].text_content().rstrip(':')), self._text(spans[1])
+
+    def _collect_kv(self, *row_groups: Iterator[Tuple[str, str]]) -> Dict[str, str]:
+        """Merge (key, value) rows into a dict, skipping empty keys/values (later rows win)"""
+        collected = {}
+        for rows in row_groups:
+            for key, value in rows:
+                if key and value:
+                    collected[key] = value
+        return collected
+
+    def _extract_specifications(self, sections: Dict[str, lxml_html.HtmlElement]) -> Dict[str, str]:
+        """Extract product specifications"""
+        try:
+            return self._collect_kv(
+                self._iter_kv_rows(sections.get('div#productDetails_techSpec_section_1'), 'th_td'),
+                self._iter_kv_rows(sections.get('table#productDetails_techSpec_section_1'), 'th_td')
+            )
         except Exception as e:
-            print(f"Error extracting product details: {str(e)}")
+            logger.warning("Error extracting specifications: %s", e)
+            return {}
 
-        return details
+    def _extract_product_details(self, detail_sections: List[lxml_html.HtmlElement]) -> Dict[str, str]:
+        """Extract product details from the page's productDetails* sections"""
+        try:
+            return self._collect_kv(*(self._iter_kv_rows(section, 'details') for section in detail_sections))
+        except Exception as e:
+            logger.warning("Error extracting product details: %s", e)
+            return {}
 
-    def _extract_technical_details(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_technical_details(self, sections: Dict[str, lxml_html.HtmlElement]) -> Dict[str, str]:
         """Extract technical specifications"""
-        tech_details = {}
-
         try:
-            tech_table = soup.find('table', {'id': 'productDetails_techSpec_section_2'})
-            if tech_table:
-                rows = tech_table.find_all('tr')
-                for row in rows:
-                    header = row.find('th')
-                    value = row.find('td')
-                    if header and value:
-                        key = self.clean_text(header.get_text())
-                        val = self.clean_text(value.get_text())
-                        if key and val:
-                            tech_details[key] = val
-
-            tech_section = soup.find('div', {'id': 'tech-spec-desktop'})
-            if tech_section:
-                rows = tech_section.find_all('tr')
-                for row in rows:
-                    cols = row.find_all(['th', 'td'])
-                    if len(cols) == 2:
-                        key = self.clean_text(cols[0].get_text())
-                        value = self.clean_text(cols[1].get_text())
-                        if key and value:
-                            tech_details[key] = value
-
+            return self._collect_kv(
+                self._iter_kv_rows(sections.get('table#productDetails_techSpec_section_2'), 'th_td'),
+                self._iter_kv_rows(sections.get('div#tech-spec-desktop'), 'cols')
+            )
         except Exception as e:
-            print(f"Error extracting technical details: {str(e)}")
-
-        return tech_details
+            logger.warning("Error extracting technical details: %s", e)
+            return {}
 
-    def _extract_additional_information(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_additional_information(self, sections: Dict[str, lxml_html.HtmlElement]) -> Dict[str, str]:
         """Extract additional product information"""
-        additional_info = {}
-
         try:
-            info_section = soup.find('div', {'id': 'productDetails_db_sections'})
-            if info_section:
-                rows = info_section.find_all('tr')
-                for row in rows:
-                    header = row.find('th')
-                    value = row.find('td')
-                    if header and value:
-                        key = self.clean_text(header.get_text())
-                        val = self.clean_text(value.get_text())
-                        if key and val:
-                            additional_info[key] = val
-
-            detail_bullets = soup.find('div', {'id': 'detailBullets_feature_div'})
-            if detail_bullets:
-                list_items = detail_bullets.find_all('li')
-                for item in list_items:
-                    spans = item.find_all('span')
-                    if len(spans) >= 2:
-                        key = self.clean_text(spans[0].get_text().rstrip(':'))
-                        value = self.clean_text(spans[1].get_text())
-                        if key and value:
-                            additional_info[key] = value
-
+            return self._collect_kv(
+                self._iter_kv_rows(sections.get('div#productDetails_db_sections'), 'th_td'),
+                self._iter_kv_rows(sections.get('div#detailBullets_feature_div'), 'spans')
+            )
         except Exception as e:
-            print(f"Error extracting additional information: {str(e)}")
+            logger.warning("Error extracting additional information: %s", e)
+            return {}
 
-        return additional_info
-
-    def _extract_warranty(self, soup: BeautifulSoup) -> str:
-        """Extract warranty information"""
+    def _extract_warranty(self, features: List[str], detail_sections: List[lxml_html.HtmlElement]) -> str:
+        """Extract warranty information from feature bullets and productDetails* sections"""
         warranty_info = ""
 
         try:
-            warranty_keywords = ['warranty', 'guarantee', 'guaranty']
-
-            features = self._extract_features(soup)
             for feature in features:
-                if any(keyword in feature.lower() for keyword in warranty_keywords):
+                if _WARRANTY_RE.search(feature):
                     warranty_info += feature + " "
 
-            detail_sections = soup.find_all('div', {'id': re.compile(r'productDetails.*')})
             for section in detail_sections:
-                text = section.get_text()
-                if any(keyword in text.lower() for keyword in warranty_keywords):
+                text = section.text_content()
+                if _WARRANTY_RE.search(text):
                     lines = text.split('\n')
                     for line in lines:
-                        if any(keyword in line.lower() for keyword in warranty_keywords):
+                        if _WARRANTY_RE.search(line):
                             warranty_info += line.strip() + " "
 
         except Exception as e:
-            print(f"Error extracting warranty: {str(e)}")
+            logger.warning("Error extracting warranty: %s", e)
 
         return warranty_info.strip() if warranty_info else "Warranty information not available"
 
-    def _extract_availability(self, soup: BeautifulSoup) -> str:
+    def _extract_availability(self, doc: lxml_html.HtmlElement) -> str:
         """Extract product availability status"""
         try:
-            availability_elem = soup.find('div', {'id': 'availability'})
-            if availability_elem:
-                return self.clean_text(availability_elem.get_text())
+            availability_elem = _first(doc, '//div[@id="availability"]')
+            if availability_elem is not None:
+                return self._text(availability_elem)
 
-            availability_span = soup.find('span', {'class': 'a-size-medium a-color-success'})
-            if availability_span:
-                return self.clean_text(availability_span.get_text())
+            availability_span = _first(doc, f'//span[{_class_pred("a-size-medium a-color-success")}]')
+            if availability_span is not None:
+                return self._text(availability_span)
 
-            out_of_stock = soup.find('span', {'class': 'a-size-medium a-color-error'})
-            if out_of_stock:
-                return self.clean_text(out_of_stock.get_text())
+            out_of_stock = _first(doc, f'//span[{_class_pred("a-size-medium a-color-error")}]')
+            if out_of_stock is not None:
+                return self._text(out_of_stock)
 
         except Exception as e:
-            print(f"Error extracting availability: {str(e)}")
+            logger.warning("Error extracting availability: %s", e)
 
         return "Availability not specified"
 
-    def _extract_images(self, soup: BeautifulSoup) -> List[str]:
-        """Extract product images from top carousel"""
+    def _extract_images(self, soup: BeautifulSoup, image_script: str) -> List[str]:
+        """Extract product images from top carousel (image_script: carousel data script body)"""
         images = []
+        seen = set()  # O(1) dedup; images keeps discovery order
 
         try:
-            print("\n🖼️  Extracting product images from top carousel...")
-
-            scripts = soup.find_all('script', {'type': 'text/javascript'})
-            for script in scripts:
-                if script.string and ('colorImages' in script.string or 'ImageBlockATF' in script.string):
-                    script_text = script.string
-
-                    color_images_match = re.search(r'"colorImages":\s*\{[^}]*"initial":\s*\[([^\]]+)\]', script_text)
-                    if color_images_match:
-                        images_json = color_images_match.group(1)
-                        large_urls = re.findall(r'"(?:large|hiRes)":\s*"([^"]+)"', images_json)
-                        for url in large_urls:
-                            if url and url.startswith('http') and url not in images:
-                                images.append(url)
-                                print(f"  ✓ Found image from colorImages: {url[:80]}...")
-
-                    if not images:
-                        hiRes_urls = re.findall(r'"hiRes":\s*"([^"]+)"', script_text)
-                        for url in hiRes_urls:
-                            if url and url.startswith('http') and url not in images:
-                                images.append(url)
-                                print(f"  ✓ Found image from hiRes: {url[:80]}...")
+            logger.debug("Extracting product images from top carousel")
+
+            if image_script:
+                color_images_match = _COLOR_IMAGES_RE.search(image_script)
+                script_urls = _LARGE_URL_RE.findall(color_images_match.group(1)) if color_images_match else []
+                if not script_urls:
+                    script_urls = _HIRES_RE.findall(image_script)
+
+                for url in script_urls:
+                    if url.startswith('http') and url not in seen:
+                        seen.add(url)
+                        images.append(url)
+                        logger.debug("Found image from carousel script: %.80s", url)
 
             if not images:
-                print("  → Trying landing image selector...")
+                logger.debug("Trying landing image selector")
                 landing_img = soup.find('img', {'id': 'landingImage'})
                 if landing_img:
                     src = landing_img.get('data-old-hires') or landing_img.get('src')
                     if src and src.startswith('http'):
+                        seen.add(src)
                         images.append(src)
-                        print(f"  ✓ Found landing image: {src[:80]}...")
+                        logger.debug("Found landing image: %.80s", src)
 
             if len(images) < 2:
-                print("  → Searching imageBlock section...")
+                logger.debug("Searching imageBlock section")
                 image_block = soup.find('div', {'id': 'imageBlock'})
                 if image_block:
                     alt_images = image_block.find('div', {'id': 'altImages'})
@@ -662,22 +771,26 @@ class AmazonScraper(BaseScraper):
                             img_tag = item.find('img')
                             if img_tag:
                                 large_url = img_tag.get('data-old-hires') or img_tag.get('src')
-                                if large_url and large_url.startswith('http') and large_url not in images:
+                                if large_url and large_url.startswith('http'):
                                     full_url = self._convert_to_fullsize_image(large_url)
-                                    images.append(full_url)
-                                    print(f"  ✓ Found image from altImages: {full_url[:80]}...")
+                                    if full_url not in seen:
+                                        seen.add(full_url)
+                                        images.append(full_url)
+                                        logger.debug("Found image from altImages: %.80s", full_url)
 
             if len(images) < 2:
-                print("  → Searching imgTagWrapperDiv...")
+                logger.debug("Searching imgTagWrapper divs")
                 thumb_wrappers = soup.find_all('div', {'class': 'imgTagWrapper'})
                 for wrapper in thumb_wrappers[:7]:
                     img = wrapper.find('img')
                     if img:
                         src = img.get('src') or img.get('data-src')
-                        if src and src.startswith('http') and src not in images:
+                        if src and src.startswith('http'):
                             full_url = self._convert_to_fullsize_image(src)
-                            images.append(full_url)
-                            print(f"  ✓ Found image from imgTagWrapper: {full_url[:80]}...")
+                            if full_url not in seen:
+                                seen.add(full_url)
+                                images.append(full_url)
+                                logger.debug("Found image from imgTagWrapper: %.80s", full_url)
 
             filtered_images = []
             for img_url in images:
@@ -685,138 +798,152 @@ class AmazonScraper(BaseScraper):
                 if not any(keyword in url_lower for keyword in ['review', 'customer-image', 'ugc-image', 'user-image']):
                     filtered_images.append(img_url)
                 else:
-                    print(f"  ✗ Filtered out review/user image: {img_url[:80]}...")
+                    logger.debug("Filtered out review/user image: %.80s", img_url)
 
-            print(f"\n✓ Total product images extracted: {len(filtered_images)}\n")
+            logger.info("Total product images extracted: %d", len(filtered_images))
             return filtered_images[:8]
 
         except Exception as e:
-            print(f"❌ Error extracting images: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error extracting images: %s", e)
             return []
 
     def _convert_to_fullsize_image(self, thumbnail_url: str) -> str:
         """Convert Amazon thumbnail URL to full-size image URL"""
-        full_size = thumbnail_url
-        full_size = re.sub(r'_[AS][XYC][\d]+_', '_AC_SL1500_', full_size)
-        full_size = re.sub(r'_AC_[A-Z]{2}[\d]+_', '_AC_SL1500_', full_size)
-        return full_size
+        return _IMG_SIZE_RE.sub('_AC_SL1500_', thumbnail_url)
 
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+    def _extract_category(self, doc: lxml_html.HtmlElement) -> str:
         """Extract product category from breadcrumbs"""
         category = ""
 
         try:
-            breadcrumbs = soup.find('ul', {'class': 'a-unordered-list a-horizontal a-size-small'})
-            if breadcrumbs:
-                items = breadcrumbs.find_all('li')
+            breadcrumbs = _first(doc, f'//ul[{_class_pred("a-unordered-list a-horizontal a-size-small")}]')
+            if breadcrumbs is not None:
+                items = breadcrumbs.iterfind('.//li')
                 categories = []
                 for item in items:
-                    link = item.find('a')
-                    if link:
-                        cat_text = self.clean_text(link.get_text())
+                    link = item.find('.//a')
+                    if link is not None:
+                        cat_text = self._text(link)
                         if cat_text:
                             categories.append(cat_text)
                 category = ' > '.join(categories)
 
             if not category:
-                breadcrumb_div = soup.find('div', {'id': 'wayfinding-breadcrumbs_feature_div'})
-                if breadcrumb_div:
-                    links = breadcrumb_div.find_all('a')
-                    categories = [self.clean_text(link.get_text()) for link in links if self.clean_text(link.get_text())]
+                breadcrumb_div = _first(doc, '//div[@id="wayfinding-breadcrumbs_feature_div"]')
+                if breadcrumb_div is not None:
+                    links = breadcrumb_div.iterfind('.//a')
+                    categories = [text for text in (self._text(link) for link in links) if text]
                     category = ' > '.join(categories)
 
         except Exception as e:
-            print(f"Error extracting category: {str(e)}")
+            logger.warning("Error extracting category: %s", e)
 
         return category if category else "Category not found"
 
-    def _scrape_reviews_from_product_page(self, soup: BeautifulSoup) -> List[Dict]:
+    def _scrape_reviews_from_product_page(self, doc: lxml_html.HtmlElement) -> List[Dict]:
         """Scrape customer reviews from product page"""
         reviews = []
 
         try:
-            review_divs = soup.find_all('div', {'data-hook': 'review'})
+            # Also covers the reviews inside #reviewsMedley
+            review_divs = _REVIEW_DIVS_XPATH(doc)
 
             if not review_divs:
-                review_divs = soup.find_all('div', {'id': re.compile(r'customer_review-.*')})
+                review_divs = _REVIEW_ID_DIVS_XPATH(doc)
 
-            if not review_divs:
-                reviews_section = soup.find('div', {'id': 'reviewsMedley'})
-                if reviews_section:
-                    review_divs = reviews_section.find_all('div', {'data-hook': 'review'})
-
-            print(f"Found {len(review_divs)} review containers on product page")
+            logger.debug("Found %d review containers on product page", len(review_divs))
 
             for review_div in review_divs:
+                parts = self._review_parts(review_div)
                 review_data = {
-                    'title': self._extract_review_title(review_div),
-                    'rating': self._extract_review_rating(review_div),
-                    'text': self._extract_review_text(review_div),
-                    'author': self._extract_review_author(review_div),
-                    'date': self._extract_review_date(review_div),
-                    'verified_purchase': self._extract_review_verified(review_div)
+                    'title': self._extract_review_title(parts),
+                    'rating': self._extract_review_rating(parts),
+                    'text': self._extract_review_text(parts),
+                    'author': self._extract_review_author(parts),
+                    'date': self._extract_review_date(parts),
+                    'verified_purchase': self._extract_review_verified(parts)
                 }
 
                 if review_data['text'] or review_data['title']:
                     reviews.append(review_data)
-                    print(f"  - Extracted review: {review_data['title'][:50]}..." if review_data['title'] else f"  - Extracted review with rating: {review_data['rating']}")
+                    logger.debug("Extracted review: %.50s (rating %s)", review_data['title'], review_data['rating'])
 
         except Exception as e:
-            print(f"Error scraping reviews from product page: {str(e)}")
+            logger.warning("Error scraping reviews from product page: %s", e)
 
         return reviews
 
-    def _extract_review_title(self, review_div: BeautifulSoup) -> str:
+    def _review_parts(self, review_div: lxml_html.HtmlElement) -> Dict[str, lxml_html.HtmlElement]:
+        """
+        Index one review's field elements with a single compiled XPath over its subtree
+
+        Args:
+            review_div: Review container
+
+        Returns:
+            First element per key, keyed 'tag[data-hook]' (e.g. 'span[review-body]')
+            or 'tag.class' (e.g. 'span.a-profile-name')
+        """
+        parts = {}
+        for element in _REVIEW_PARTS_XPATH(review_div):
+            hook = element.get('data-hook')
+            if hook:
+                parts.setdefault(f"{element.tag}[{hook}]", element)
+            for class_name in _REVIEW_PART_CLASSES.intersection((element.get('class') or '').split()):
+                parts.setdefault(f"{element.tag}.{class_name}", element)
+        return parts
+
+    def _spaced_text(self, element: lxml_html.HtmlElement) -> str:
+        """Cleaned text with a space between text nodes (BeautifulSoup get_text(' ', strip=True))"""
+        return self.clean_text(' '.join(element.itertext()))
+
+    def _extract_review_title(self, parts: Dict[str, lxml_html.HtmlElement]) -> str:
         """Extract review title"""
-        title_elem = review_div.find('a', {'data-hook': 'review-title'})
-        if not title_elem:
-            title_elem = review_div.find('span', {'data-hook': 'review-title'})
+        title_elem = parts.get('a[review-title]')
+        if title_elem is None:
+            title_elem = parts.get('span[review-title]')
 
-        if title_elem:
-            return self.clean_text(title_elem.get_text())
+        if title_elem is not None:
+            return self._spaced_text(title_elem)
         return ""
 
-    def _extract_review_rating(self, review_div: BeautifulSoup) -> str:
+    def _extract_review_rating(self, parts: Dict[str, lxml_html.HtmlElement]) -> str:
         """Extract review rating"""
-        rating_elem = review_div.find('i', {'data-hook': 'review-star-rating'})
-        if not rating_elem:
-            rating_elem = review_div.find('span', {'class': 'a-icon-alt'})
+        rating_elem = parts.get('i[review-star-rating]')
+        if rating_elem is None:
+            rating_elem = parts.get('span.a-icon-alt')
 
-        if rating_elem:
-            text = rating_elem.get_text().strip()
-            parsed = self.parse_rating(text)
+        if rating_elem is not None:
+            parsed = self.parse_rating(self._spaced_text(rating_elem))
             if parsed:
                 return parsed
         return ""
 
-    def _extract_review_text(self, review_div: BeautifulSoup) -> str:
+    def _extract_review_text(self, parts: Dict[str, lxml_html.HtmlElement]) -> str:
         """Extract review text"""
-        text_elem = review_div.find('span', {'data-hook': 'review-body'})
-        if text_elem:
-            return self.clean_text(text_elem.get_text())
+        text_elem = parts.get('span[review-body]')
+        if text_elem is not None:
+            return self._spaced_text(text_elem)
         return ""
 
-    def _extract_review_author(self, review_div: BeautifulSoup) -> str:
+    def _extract_review_author(self, parts: Dict[str, lxml_html.HtmlElement]) -> str:
         """Extract review author name"""
-        author_elem = review_div.find('span', {'class': 'a-profile-name'})
-        if author_elem:
-            return self.clean_text(author_elem.get_text())
+        author_elem = parts.get('span.a-profile-name')
+        if author_elem is not None:
+            return self._spaced_text(author_elem)
         return "Anonymous"
 
-    def _extract_review_date(self, review_div: BeautifulSoup) -> str:
+    def _extract_review_date(self, parts: Dict[str, lxml_html.HtmlElement]) -> str:
         """Extract review date"""
-        date_elem = review_div.find('span', {'data-hook': 'review-date'})
-        if date_elem:
-            text = date_elem.get_text().strip()
-            match = re.search(r'on (.+)$', text)
+        date_elem = parts.get('span[review-date]')
+        if date_elem is not None:
+            text = self._spaced_text(date_elem)
+            match = _REVIEW_DATE_RE.search(text)
             if match:
                 return match.group(1)
             return text
         return ""
 
-    def _extract_review_verified(self, review_div: BeautifulSoup) -> bool:
+    def _extract_review_verified(self, parts: Dict[str, lxml_html.HtmlElement]) -> bool:
         """Check if review is verified purchase"""
-        verified_elem = review_div.find('span', {'data-hook': 'avp-badge'})
-        return verified_elem is not None
+        return 'span[avp-badge]' in parts
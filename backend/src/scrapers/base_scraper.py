@@ -4,10 +4,35 @@ Defines the contract that all platform scrapers must implement
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+import asyncio
 import re
 
 
+# Product pages fetched at once by the default scrape_many
+MAX_CONCURRENT_SCRAPES = 8
+
+# Texts up to this length go through the clean_text memo; longer ones (review bodies,
+# descriptions) are nearly always unique and would only evict the repeats
+CLEAN_TEXT_CACHE_MAX_LEN = 256
+
+# Shared text/price/rating patterns, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+# Rating with an optional "out of N" scale (defaults to 5), in one search
+_RATING_RE = re.compile(r'(\d+\.?\d*)(?:\s*out of\s*(\d+))?', re.IGNORECASE)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends"""
+    return _WS_RE.sub(' ', text).strip()
+
+
+# Short fields (authors, dates, badges, ratings) repeat heavily across a page
+_collapse_whitespace_cached = lru_cache(maxsize=4096)(_collapse_whitespace)
+
+
 class BaseScraper(ABC):
     """Abstract base class for all e-commerce platform scrapers"""
 
@@ -54,6 +79,27 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def scrape_many(self, urls: List[str]) -> List[Union[Dict, Exception]]:
+        """
+        Scrape several product pages concurrently
+
+        Runs the blocking scrape_product in worker threads, at most MAX_CONCURRENT_SCRAPES
+        at a time. Scrapers with a native async fetch path override this.
+
+        Args:
+            urls: Product URLs
+
+        Returns:
+            One entry per URL, in order: product data, or the exception that URL raised
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+        async def scrape(url: str) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(self.scrape_product, url)
+
+        return await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+
     @abstractmethod
     def get_platform_name(self) -> str:
         """
@@ -78,10 +124,11 @@ class BaseScraper(ABC):
             return ""
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-
-        return text
+        if len(text) <= CLEAN_TEXT_CACHE_MAX_LEN:
+            # str() is a no-op for plain str; str subclasses (e.g. lxml smart strings)
+            # would otherwise pin their parse tree in the cache
+            return _collapse_whitespace_cached(str(text))
+        return _collapse_whitespace(text)
 
     def parse_price(self, price_text: str) -> Optional[str]:
         """
@@ -97,7 +144,7 @@ class BaseScraper(ABC):
             return None
 
         # Extract numeric price
-        price_match = re.search(r'[\d,]+\.?\d*', price_text)
+        price_match = _PRICE_RE.search(price_text)
         if price_match:
             return price_match.group()
 
@@ -116,14 +163,9 @@ class BaseScraper(ABC):
         if not rating_text:
             return None
 
-        # Extract numeric rating
-        rating_match = re.search(r'(\d+\.?\d*)\s*out of\s*(\d+)', rating_text, re.IGNORECASE)
-        if rating_match:
-            return f"{rating_match.group(1)}/{rating_match.group(2)}"
-
-        # Try simple numeric rating
-        rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+        # Extract numeric rating ("4.5 out of 5" or a bare "4.5")
+        rating_match = _RATING_RE.search(rating_text)
         if rating_match:
-            return f"{rating_match.group(1)}/5"
+            return f"{rating_match.group(1)}/{rating_match.group(2) or '5'}"
 
         return None
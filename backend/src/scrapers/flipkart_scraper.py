@@ -144,8 +144,8 @@ class FlipkartScraper(BaseScraper):
             # Use LLM extraction to enhance and fill missing data
             try:
                 print("🤖 Enhancing data with LLM extraction...")
-                # Pass BeautifulSoup object directly instead of raw HTML to avoid double parsing
-                llm_data = self.llm_extractor.extract_product_data(soup, url)
+                # Pass raw HTML - the extractor parses it with lxml directly
+                llm_data = self.llm_extractor.extract_product_data(response.content, url)
 
                 # Merge LLM data with traditional scraping
                 product_data = self._merge_product_data(product_data, llm_data)
@@ -11,10 +11,15 @@ import redis
 import sys
 
 
+# Key prefix of the per-session chat message lists (written by the chatbot, read by /history)
+CHAT_HISTORY_KEY_PREFIX = "message_store:"
+
+
 class RedisManager:
     """Singleton Redis client manager - Redis is REQUIRED"""
 
     _instance: redis.Redis = None
+    _pool: redis.ConnectionPool = None
     _initialized: bool = False
 
     @classmethod
@@ -27,6 +32,7 @@ class RedisManager:
         - REDIS_PORT: Redis server port (default: 6379)
         - REDIS_DB: Redis database number (default: 0)
         - REDIS_PASSWORD: Redis password (optional)
+        - REDIS_POOL_SIZE: Max pooled connections (default: 64)
 
         Args:
             force_reconnect: Force create a new connection
@@ -55,13 +61,21 @@ class RedisManager:
             SystemExit: If Redis connection fails
         """
         try:
-            client = redis.Redis(
+            # One shared pool sized for concurrent requests; keepalive + health checks
+            # avoid reconnecting (or failing on) connections dropped while idle
+            if cls._pool is not None:
+                cls._pool.disconnect()
+            cls._pool = redis.ConnectionPool(
                 host=os.getenv('REDIS_HOST', 'localhost'),
                 port=int(os.getenv('REDIS_PORT', '6379')),
                 db=int(os.getenv('REDIS_DB', '0')),
                 password=os.getenv('REDIS_PASSWORD'),
+                max_connections=int(os.getenv('REDIS_POOL_SIZE', '64')),
+                socket_keepalive=True,
+                health_check_interval=30,
                 decode_responses=True
             )
+            client = redis.Redis(connection_pool=cls._pool)
 
             # Test connection - this will raise an exception if Redis is not available
             client.ping()
@@ -84,15 +98,17 @@ class RedisManager:
 
     @classmethod
     def close(cls):
-        """Close Redis connection"""
+        """Close Redis connection and disconnect the pool"""
         if cls._instance:
             try:
                 cls._instance.close()
+                cls._pool.disconnect()
                 print("✓ Redis connection closed")
             except:
                 pass
             finally:
                 cls._instance = None
+                cls._pool = None
                 cls._initialized = False
 
 
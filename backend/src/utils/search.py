@@ -5,7 +5,32 @@ Supports multiple search providers: DuckDuckGo (free, default) or Serper (Google
 
 import os
 import requests
-from typing import Dict, List
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+
+
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a requests Session with a keep-alive connection pool
+
+    Args:
+        pool_size: Max pooled connections per host (default: 10)
+
+    Returns:
+        Session that reuses TCP/TLS connections across calls
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _default_session() -> requests.Session:
+    """Shared session for callers that don't pass their own"""
+    return create_http_session()
 
 
 def search(
@@ -51,7 +76,7 @@ def _search_serper(query: str, location: str, num_results: int) -> List[Dict]:
     }
 
     try:
-        response = requests.post(
+        response = _default_session().post(
             "https://google.serper.dev/search",
             headers=headers,
             json=payload,
@@ -110,7 +135,8 @@ def _search_duckduckgo(query: str, num_results: int) -> List[Dict]:
 def search_shopping(
     product_name: str,
     location: str = "India",
-    num_results: int = 20
+    num_results: int = 20,
+    session: Optional[requests.Session] = None
 ) -> Dict:
     """
     Search for product prices across shopping platforms
@@ -119,6 +145,8 @@ def search_shopping(
         product_name: Product name to search for
         location: Search location (default: "India")
         num_results: Number of results to fetch
+        session: Session used for Serper requests so connections are reused
+            (default: a shared module-level session)
 
     Returns:
         Dictionary with shopping results
@@ -126,12 +154,17 @@ def search_shopping(
     provider = os.getenv('SEARCH_PROVIDER', 'duckduckgo').lower()
 
     if provider == 'serper':
-        return _search_shopping_serper(product_name, location, num_results)
+        return _search_shopping_serper(product_name, location, num_results, session)
     else:
         return _search_shopping_duckduckgo(product_name, num_results)
 
 
-def _search_shopping_serper(product_name: str, location: str, num_results: int) -> Dict:
+def _search_shopping_serper(
+    product_name: str,
+    location: str,
+    num_results: int,
+    session: Optional[requests.Session] = None
+) -> Dict:
     """Search shopping using Serper API"""
     api_key = os.getenv('SERPER_API_KEY')
     if not api_key:
@@ -150,7 +183,7 @@ def _search_shopping_serper(product_name: str, location: str, num_results: int)
             "Content-Type": "application/json"
         }
 
-        response = requests.post(
+        response = (session or _default_session()).post(
             "https://google.serper.dev/shopping",
             json=payload,
             headers=headers,
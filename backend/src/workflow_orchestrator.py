@@ -4,6 +4,7 @@ Handles parallel execution of scraping, price comparison, and web search
 """
 
 import json
+import orjson
 from typing import Dict, Optional, TypedDict, Annotated
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
@@ -34,6 +35,9 @@ class ProductWorkflowState(TypedDict):
     # Analysis output
     analysis: Optional[str]
 
+    # True when product_data was served from the Redis cache
+    cache_hit: bool
+
     # Error tracking - allows multiple nodes to add errors concurrently
     errors: Annotated[list, operator.add]
 
@@ -115,7 +119,7 @@ class ProductWorkflowOrchestrator:
             cached_analysis = self.redis_client.get(analysis_cache_key)
 
             if cached_json:
-                cached_data = json.loads(cached_json)
+                cached_data = orjson.loads(cached_json)
 
                 # Check if cached data has all requested components based on available services
                 has_price_comp = "price_comparison" in cached_data or "competitor_prices" in cached_data
@@ -130,6 +134,7 @@ class ProductWorkflowOrchestrator:
                 if cache_complete:
                     print(f"  ✓ Complete cached data found for product ID: {product_id}")
                     state["product_data"] = cached_data
+                    state["cache_hit"] = True
                     state["scraping_complete"] = True
                     state["price_comparison_complete"] = True
                     state["web_search_complete"] = True
@@ -324,7 +329,8 @@ class ProductWorkflowOrchestrator:
             asin = state.get("asin")
             if asin:
                 cache_key = f"product:{asin}"
-                product_json = json.dumps(state["product_data"], ensure_ascii=False)
+                # Compact orjson encoding (no whitespace) keeps the payload small
+                product_json = orjson.dumps(state["product_data"])
                 self.redis_client.setex(cache_key, 86400, product_json)  # 24 hour TTL
                 print(f"  ✓ Saved to Redis: {cache_key} (TTL: 24 hours)")
             else:
@@ -397,6 +403,7 @@ class ProductWorkflowOrchestrator:
             web_search_data=None,
             product_data=None,
             analysis=None,
+            cache_hit=False,
             errors=[],
             scraping_complete=False,
             price_comparison_complete=False,
@@ -421,6 +428,7 @@ class ProductWorkflowOrchestrator:
                 "success": True,
                 "data": final_state.get("product_data", {}),
                 "analysis": final_state.get("analysis", ""),
+                "cache_hit": final_state.get("cache_hit", False),
                 "errors": final_state.get("errors", [])
             }
 
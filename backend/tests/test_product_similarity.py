@@ -0,0 +1,75 @@
+"""
+Offline tests for price comparison title matching (no search API calls)
+"""
+
+import pytest
+
+from src.price_comparison import SerperPriceComparison, _title_tokens
+
+ORIGINAL = "Samsung Galaxy S23 5G (Phantom Black, 8GB RAM, 128GB Storage)"
+
+
+@pytest.fixture(scope="module")
+def comparer():
+    return SerperPriceComparison()
+
+
+def test_identical_titles_score_one(comparer):
+    assert comparer._calculate_product_similarity(ORIGINAL, ORIGINAL) == pytest.approx(1.0)
+
+
+def test_same_product_reworded_matches(comparer):
+    result = "Samsung Galaxy S23 5G 128GB 8GB RAM Phantom Black"
+
+    assert comparer._is_same_product(ORIGINAL, result)
+
+
+def test_different_storage_scores_lower(comparer):
+    title = "Apple iPhone 15 (128GB) - Black"
+
+    assert comparer._calculate_product_similarity(title, "Apple iPhone 15 (256GB) - Black") < \
+        comparer._calculate_product_similarity(title, "Apple iPhone 15 (128GB) - Black")
+
+
+def test_different_brand_is_rejected(comparer):
+    assert not comparer._is_same_product(ORIGINAL, "Apple iPhone 15 (Black, 128GB)")
+
+
+def test_word_order_does_not_matter(comparer):
+    assert comparer._calculate_product_similarity(
+        "Apple iPhone 15 Pro 256GB", "iPhone 15 Pro 256GB - Apple"
+    ) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("result", [
+    "Samsung Galaxy S23 5G 128GB 8GB RAM Phantom Black",
+    "Samsung Galaxy S23 FE 5G (Mint, 8GB RAM, 256GB Storage)",
+    "Apple iPhone 15 (Black, 128GB)",
+    "Phantom Black phone cover",
+])
+def test_threshold_never_changes_the_decision(comparer, result):
+    full = comparer._calculate_product_similarity(ORIGINAL, result)
+    early = comparer._calculate_product_similarity(ORIGINAL, result, threshold=0.65)
+
+    assert (full >= 0.65) == (early >= 0.65)
+    # The early exit only drops the text term, so it never scores higher
+    assert early <= full
+
+
+def test_threshold_exits_early_when_out_of_reach(comparer):
+    result = "Apple iPhone 15 (Black, 128GB)"
+    full = comparer._calculate_product_similarity(ORIGINAL, result)
+
+    # At threshold 1.0 only a full attribute match can qualify, so the text term is skipped
+    early = comparer._calculate_product_similarity(ORIGINAL, result, threshold=1.0)
+
+    assert early < full
+
+
+def test_precomputed_inputs_match_plain_call(comparer):
+    result = "Samsung Galaxy S23 5G 128GB 8GB RAM Phantom Black"
+    result_lower = result.lower()
+
+    assert comparer._calculate_product_similarity(
+        ORIGINAL, result, ORIGINAL.lower(), result_lower, _title_tokens(result_lower)
+    ) == pytest.approx(comparer._calculate_product_similarity(ORIGINAL, result))
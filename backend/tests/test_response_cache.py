@@ -0,0 +1,191 @@
+"""
+Offline tests for the response cache, ETag handling and validated product cache
+(Redis is replaced by an in-memory fake; no network or Redis server needed)
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from api.models.schemas import ScrapeRequest
+from api.routes.products import _etag_matches, scrape_and_analyze_product
+from api.services.product_service import ProductService
+
+PRODUCT_URL = "https://www.amazon.in/dp/B0TEST1234"
+PRODUCT_ID = "B0TEST1234"
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the decode_responses=True client"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.decode("utf-8") if isinstance(value, bytes) else value
+        self.ttls[key] = ttl
+
+    def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and applies them to the FakeRedis on execute()"""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    def execute(self):
+        for command in self.commands:
+            self.client.setex(*command)
+        self.commands = []
+
+
+class FakeRequest:
+    """Just enough of starlette's Request for the route's If-None-Match lookup"""
+
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def service(redis_client):
+    # Skip __init__: it connects to Redis and builds the LLM workflow
+    service = ProductService.__new__(ProductService)
+    service.redis_client = redis_client
+    return service
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ('"xyz"', False),
+    ("*", True),
+])
+def test_etag_matches(header, expected):
+    assert _etag_matches(header, '"abc"') is expected
+
+
+def test_cache_response_round_trip(service, redis_client):
+    redis_client.setex(f"product:{PRODUCT_ID}", 1200, b"{}")
+    body = b'{"success":true}'
+    etag = service.compute_etag(body)
+
+    service.cache_response(PRODUCT_URL, PRODUCT_ID, body, etag)
+
+    assert service.get_cached_response(PRODUCT_URL) == (body.decode("utf-8"), etag)
+    # Response entries expire together with the product data they were built from
+    key = service._response_cache_key(PRODUCT_URL)
+    assert redis_client.ttl(key) == 1200
+    assert redis_client.ttl(f"{key}:etag") == 1200
+
+
+def test_cache_response_skipped_without_product_entry(service):
+    body = b'{"success":true}'
+    service.cache_response(PRODUCT_URL, PRODUCT_ID, body, service.compute_etag(body))
+
+    assert service.get_cached_response(PRODUCT_URL) is None
+
+
+def test_cached_response_without_etag_gets_computed_one(service, redis_client):
+    body = '{"success":true}'
+    redis_client.setex(service._response_cache_key(PRODUCT_URL), 600, body)
+
+    assert service.get_cached_response(PRODUCT_URL) == (body, service.compute_etag(body.encode("utf-8")))
+
+
+def test_compute_etag_is_quoted_and_content_based(service):
+    etag = service.compute_etag(b"a")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == service.compute_etag(b"a")
+    assert etag != service.compute_etag(b"b")
+
+
+class CachedProductService:
+    """Route dependency stand-in that always has a cached response"""
+
+    body = '{"success":true}'
+    etag = '"abc"'
+
+    def get_cached_response(self, url):
+        return self.body, self.etag
+
+    async def scrape_and_analyze_unified(self, url):
+        raise AssertionError("cached responses must not run the workflow")
+
+
+def _call_route(headers=None):
+    return asyncio.run(scrape_and_analyze_product(
+        ScrapeRequest(url=PRODUCT_URL),
+        FakeRequest(headers),
+        product_service=CachedProductService()
+    ))
+
+
+def test_route_returns_304_for_matching_if_none_match():
+    response = _call_route({"if-none-match": '"abc"'})
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "max-age=300"
+
+
+def test_route_returns_cached_body_otherwise():
+    response = _call_route({"if-none-match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.body == CachedProductService.body.encode("utf-8")
+    assert response.headers["etag"] == '"abc"'
+    assert response.media_type == "application/json"
+
+
+def test_validated_copy_inherits_product_ttl(service, redis_client):
+    redis_client.setex(f"product:{PRODUCT_ID}", 900, b"{}")
+
+    validated = service._get_validated_product_data(
+        {"product_id": PRODUCT_ID, "title": "Test Phone"}, cache_hit=False
+    )
+
+    assert validated["_validated"] is True
+    assert redis_client.ttl(f"product:{PRODUCT_ID}:validated") == 900
+    assert orjson.loads(redis_client.get(f"product:{PRODUCT_ID}:validated")) == validated
+
+
+def test_validated_copy_not_cached_without_product_entry(service, redis_client):
+    service._get_validated_product_data({"product_id": PRODUCT_ID, "title": "Test Phone"}, cache_hit=False)
+
+    assert redis_client.get(f"product:{PRODUCT_ID}:validated") is None
+
+
+def test_validated_copy_reused_on_cache_hit(service, redis_client):
+    cached = {"product_id": PRODUCT_ID, "title": "Cached", "_validated": True}
+    redis_client.setex(f"product:{PRODUCT_ID}:validated", 900, orjson.dumps(cached))
+
+    assert service._get_validated_product_data(
+        {"product_id": PRODUCT_ID, "title": "Fresh"}, cache_hit=True
+    ) == cached
@@ -0,0 +1,69 @@
+"""
+Offline tests for ProductData.from_validated (the no-revalidation rebuild path)
+"""
+
+from api.models.schemas import BankOffer, CompetitorPrice, PriceComparison, ProductData, Review
+
+RAW_PRODUCT = {
+    "product_id": "B0TEST1234",
+    "platform": "Amazon",
+    "asin": "B0TEST1234",
+    "title": "Test Phone 5G (128GB, Black)",
+    "brand": "Test",
+    "price": "₹19,999",
+    "rating": "4.3 out of 5 stars",
+    "features": ["6.5 inch display", "5000 mAh battery"],
+    "specifications": {"RAM": "8 GB"},
+    "product_details": {"Weight": "190 g", "In the box": ["Phone", "Cable"]},
+    "images": ["https://example.com/1.jpg"],
+    "reviews": [
+        {"rating": "5.0", "title": "Great", "text": "Works well", "date": "1 Jan 2024",
+         "verified_purchase": True, "helpful_votes": 3},
+        {"rating": "2.0", "title": "Meh", "text": "Battery drains", "date": "2 Jan 2024",
+         "verified_purchase": False},
+    ],
+    "bank_offers": [
+        {"bank": "HDFC", "offer_type": "Discount", "description": "₹1,000 off", "discount_amount": 1000.0},
+    ],
+    "competitor_prices": [
+        {"site": "Flipkart", "price": "₹19,499", "url": "https://example.com/p", "availability": "In stock"},
+    ],
+    "price_comparison": {"current_price": "₹19,999", "alternative_prices": [], "best_deal": "Flipkart"},
+    "web_search_analysis": {"key_findings": ["Good battery"]},
+    "pros": ["Battery"],
+    "workflow_only_field": "dropped by extra='ignore'",
+}
+
+
+def _validated_dump() -> dict:
+    return ProductData.model_validate(RAW_PRODUCT).model_dump(mode="json")
+
+
+def test_from_validated_matches_model_validate():
+    dump = _validated_dump()
+
+    rebuilt = ProductData.from_validated(dump)
+    validated = ProductData.model_validate(dump)
+
+    assert rebuilt.model_dump(mode="json") == validated.model_dump(mode="json")
+
+
+def test_from_validated_builds_nested_models():
+    product = ProductData.from_validated(_validated_dump())
+
+    assert all(isinstance(review, Review) for review in product.reviews)
+    assert isinstance(product.bank_offers[0], BankOffer)
+    assert isinstance(product.competitor_prices[0], CompetitorPrice)
+    assert isinstance(product.price_comparison, PriceComparison)
+    # PriceComparison allows extra fields; they must survive the rebuild
+    assert product.price_comparison.model_dump()["best_deal"] == "Flipkart"
+
+
+def test_from_validated_without_optional_sections():
+    dump = ProductData.model_validate({"product_id": "B0TEST1234", "title": "Minimal"}).model_dump(mode="json")
+
+    product = ProductData.from_validated(dump)
+
+    assert product.price_comparison is None
+    assert product.reviews == []
+    assert product.model_dump(mode="json") == dump